@@ -7,4 +7,5 @@ __all__ = [
     "id_sheet_generator",
     "omr_runner",
     "result_parser",
+    "json_io",
 ]
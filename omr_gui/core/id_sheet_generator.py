@@ -2,20 +2,42 @@
 
 from __future__ import annotations
 
-import json
+import filecmp
+import functools
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
+from .json_io import write_json
 from .template_io import save_template
 from .template_model import CustomLabelGroup, FieldBlock, PageSettings, TemplateModel
 from .project_model import Project
 
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+_FONT = ImageFont.load_default()
 
-@dataclass
+
+def _build_digit_glyphs() -> list[tuple[Image.Image, int, int, int]]:
+    """Rasterise 0-9 once as paste masks: (mask, left, top, text height)."""
+    glyphs = []
+    for digit in range(10):
+        text = str(digit)
+        left, top, right, bottom = _FONT.getbbox(text)
+        mask = Image.new("L", (max(1, right - left), max(1, bottom - top)), 0)
+        ImageDraw.Draw(mask).text((-left, -top), text, fill=255, font=_FONT)
+        glyphs.append((mask, left, top, bottom - top))
+    return glyphs
+
+
+_DIGIT_GLYPHS = _build_digit_glyphs()
+
+
+@dataclass(frozen=True, slots=True)
 class IdSheetParams:
     """User-configurable parameters for an ID sheet."""
 
@@ -33,7 +55,7 @@ class IdSheetParams:
     class_digits: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratedSheet:
     """Paths to generated artifacts."""
 
@@ -43,57 +65,119 @@ class GeneratedSheet:
     project_path: Optional[Path]
 
 
-def _draw_markers(draw: ImageDraw.ImageDraw, width: int, height: int, size: int) -> None:
-    draw.rectangle([0, 0, size, size], fill="black")
-    draw.rectangle([width - size, 0, width - 1, size], fill="black")
-    draw.rectangle([0, height - size, size, height - 1], fill="black")
-    draw.rectangle([width - size, height - size, width - 1, height - 1], fill="black")
+def _fill_boxes(
+    arr: np.ndarray, origins: Sequence[tuple[int, int]], width: int, height: int, value: int
+) -> None:
+    """Fill ``width`` x ``height`` boxes at each (x, y) origin with ``value``."""
+    for x0, y0 in origins:
+        arr[y0 : y0 + height, x0 : x0 + width] = value
+
 
+def _ring_tile(radius: int, width: int = 2) -> np.ndarray:
+    """Boolean mask of a bubble outline centred in a (2r+3) x (2r+3) tile."""
+    size = 2 * radius + 3
+    offsets = np.arange(size) - (radius + 1)
+    dist2 = offsets[:, None] ** 2 + offsets[None, :] ** 2
+    return (dist2 > (radius - width + 0.5) ** 2) & (dist2 <= (radius + 0.5) ** 2)
 
-def _draw_markers_box(
-    draw: ImageDraw.ImageDraw, x0: int, y0: int, x1: int, y1: int, size: int
+
+def _stamp_rings(
+    mask: np.ndarray, ring: np.ndarray, centers_x: np.ndarray, centers_y: np.ndarray
+) -> None:
+    """OR the ring tile into mask at every (x, y) centre, clipped to the mask."""
+    height, width = mask.shape
+    half = ring.shape[0] // 2
+    for cx, cy in zip(centers_x.tolist(), centers_y.tolist()):
+        x0, y0 = cx - half, cy - half
+        x1, y1 = x0 + ring.shape[1], y0 + ring.shape[0]
+        cx0, cy0 = max(0, x0), max(0, y0)
+        cx1, cy1 = min(width, x1), min(height, y1)
+        if cx0 >= cx1 or cy0 >= cy1:
+            continue
+        mask[cy0:cy1, cx0:cx1] |= ring[cy0 - y0 : cy1 - y0, cx0 - x0 : cx1 - x0]
+
+
+@functools.lru_cache(maxsize=16)
+def _marker_frame(
+    marker_w: int, marker_h: int, span_x: int, span_y: int
+) -> tuple[Image.Image, Image.Image]:
+    """Four markers spaced (span_x, span_y) apart, with the mask that covers them."""
+    marker = _resized_marker_image(marker_w, marker_h)
+    size = (span_x + marker_w, span_y + marker_h)
+    origins = ((0, 0), (span_x, 0), (0, span_y), (span_x, span_y))
+    frame = Image.new("L", size, 255)
+    for origin in origins:
+        frame.paste(marker, origin)
+    mask = np.zeros((size[1], size[0]), dtype=np.uint8)
+    _fill_boxes(mask, origins, marker_w, marker_h, 255)
+    return frame, Image.fromarray(mask)
+
+
+def _draw_bubble_columns(
+    image: Image.Image,
+    bubble_mask: np.ndarray,
+    ring: np.ndarray,
+    column_xs: np.ndarray,
+    digit_ys: np.ndarray,
+    text_offset_x: int,
 ) -> None:
-    """Draw four markers around a bounding box."""
-    draw.rectangle([x0, y0, x0 + size, y0 + size], fill="black")
-    draw.rectangle([x1 - size, y0, x1 - 1, y0 + size], fill="black")
-    draw.rectangle([x0, y1 - size, x0 + size, y1 - 1], fill="black")
-    draw.rectangle([x1 - size, y1 - size, x1 - 1, y1 - 1], fill="black")
+    """Stamp a 0-9 bubble column at each x and write the digit beside every bubble."""
+    centers_x, centers_y = np.meshgrid(column_xs, digit_ys)
+    _stamp_rings(bubble_mask, ring, centers_x.ravel(), centers_y.ravel())
+    for column_x in column_xs.tolist():
+        text_x = column_x + text_offset_x
+        for (glyph, left, top, text_h), center_y in zip(_DIGIT_GLYPHS, digit_ys.tolist()):
+            image.paste(0, (text_x + left, center_y - text_h // 2 + top), glyph)
 
 
 def _default_marker_source_path() -> Path:
-    repo_root = Path(__file__).resolve().parents[2]
-    return repo_root / "samples" / "sample1" / "omr_marker.jpg"
+    return _REPO_ROOT / "samples" / "sample1" / "omr_marker.jpg"
 
 
+@functools.lru_cache(maxsize=1)
 def _load_default_marker_image() -> Image.Image:
     src = _default_marker_source_path()
     if src.exists():
-        return Image.open(src).convert("RGB")
+        return Image.open(src).convert("L")
     raise FileNotFoundError(f"Default marker not found: {src}")
 
 
+@functools.lru_cache(maxsize=32)
+def _resized_marker_image(width: int, height: int) -> Image.Image:
+    """Return the default marker resized to (width, height); shared, do not mutate."""
+    return _load_default_marker_image().resize((width, height))
+
+
 def _ensure_marker_file(marker_path: Path) -> None:
-    marker_path.parent.mkdir(parents=True, exist_ok=True)
     src = _default_marker_source_path()
-    if not src.exists():
+    if not src.is_file():
         raise FileNotFoundError(f"Default marker not found: {src}")
-    shutil.copyfile(src, marker_path)
+    # Regenerating into the same project keeps the copy already in place.
+    # copy2 preserves the mtime, so an intact copy matches on the stat
+    # signature alone; anything else falls back to comparing contents.
+    if marker_path.is_file() and filecmp.cmp(src, marker_path, shallow=True):
+        return
+    shutil.copy2(src, marker_path)
 
 
 def generate_id_sheet(
-    params: IdSheetParams, output_dir: Path, base_name: str = "student_id"
+    params: IdSheetParams,
+    output_dir: Path,
+    base_name: str = "student_id",
+    *,
+    fast_preview: bool = False,
 ) -> GeneratedSheet:
     """
     Generate a printable ID answer sheet and its template/config JSON files.
+    fast_preview favours PNG write speed over file size; leave it off for exports.
     """
     # Treat output_dir as project root and create standard structure.
     project_root = output_dir
     config_dir = project_root / "config"
     input_dir = project_root / "input"
     output_root = project_root / "output"
-    config_dir.mkdir(parents=True, exist_ok=True)
-    input_dir.mkdir(parents=True, exist_ok=True)
-    output_root.mkdir(parents=True, exist_ok=True)
+    for directory in (config_dir, input_dir, output_root):
+        directory.mkdir(parents=True, exist_ok=True)
 
     image_path = config_dir / "sheet.png"
     template_path = config_dir / "template.json"
@@ -103,7 +187,10 @@ def generate_id_sheet(
     _ensure_marker_file(marker_path)
 
     image, labels, class_labels, _label_start_x, _label_start_y, marker_w, marker_h = render_sheet_image(params)
-    image.save(image_path)
+    if fast_preview:
+        image.save(image_path, format="PNG", compress_level=1, optimize=False)
+    else:
+        image.save(image_path, format="PNG", compress_level=9, optimize=True)
 
     gap = max(0, int(params.marker_gap))
     total_columns = params.num_digits + (params.class_digits if params.include_class else 0)
@@ -178,13 +265,12 @@ def generate_id_sheet(
             "show_image_level": 0
         },
     }
-    config_path.write_text(json.dumps(config, indent=2), encoding="utf-8")
+    write_json(config_path, config)
 
     # Create project file for convenience
-    omr_root = Path(__file__).resolve().parents[2]
     project = Project(
         name=base_name,
-        omrchecker_root=omr_root,
+        omrchecker_root=_REPO_ROOT,
         template_path=template_path,
         config_path=config_path,
         evaluation_path=None,
@@ -202,14 +288,31 @@ def generate_id_sheet(
     )
 
 
+def _generate_id_sheet_job(job: tuple[IdSheetParams, Path, str]) -> GeneratedSheet:
+    params, output_dir, base_name = job
+    return generate_id_sheet(params, output_dir, base_name=base_name)
+
+
+def generate_id_sheets_batch(
+    jobs: Sequence[tuple[IdSheetParams, Path, str]],
+    max_workers: Optional[int] = None,
+) -> list[GeneratedSheet]:
+    """
+    Generate several ID sheets, one (params, output_dir, base_name) job each.
+    Jobs share no state, so they run in parallel worker processes; results keep job order.
+    """
+    if len(jobs) <= 1:
+        return [_generate_id_sheet_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_generate_id_sheet_job, jobs))
+
+
 def render_sheet_image(
     params: IdSheetParams,
 ) -> tuple[Image.Image, list[str], list[str], int, int, int, int]:
     """Render the ID sheet to a Pillow image and return metadata."""
-    image = Image.new("RGB", (params.page_width, params.page_height), "white")
-    draw = ImageDraw.Draw(image)
-
-    font = ImageFont.load_default()
+    # The sheet is pure black-on-white, so compose it as 8-bit grayscale.
+    image = Image.new("L", (params.page_width, params.page_height), 255)
     gap = max(0, int(params.marker_gap))
 
     total_columns = params.num_digits + (params.class_digits if params.include_class else 0)
@@ -272,74 +375,40 @@ def render_sheet_image(
     else:
         region_y0 = max(min_y0, min(max_y0_fit, desired_y0))
 
-    marker = base_marker.resize((marker_w, marker_h)).convert("RGB")
-
     label_start_x = int(round(region_x0 + params.bubble_radius))
     label_start_y = int(round(region_y0 + params.bubble_radius))
 
-    labels: list[str] = []
+    labels = [f"sid{col + 1}" for col in range(params.num_digits)]
     class_labels: list[str] = []
-    for col in range(params.num_digits):
-        label = f"sid{col + 1}"
-        labels.append(label)
-        column_x = label_start_x + col * params.labels_gap
-        for digit in range(10):
-            center_y = label_start_y + digit * params.bubbles_gap
-            bbox = [
-                column_x - params.bubble_radius,
-                center_y - params.bubble_radius,
-                column_x + params.bubble_radius,
-                center_y + params.bubble_radius,
-            ]
-            draw.ellipse(bbox, outline="black", width=2)
-            text = str(digit)
-            bbox_text = draw.textbbox((0, 0), text, font=font)
-            text_w, text_h = bbox_text[2] - bbox_text[0], bbox_text[3] - bbox_text[1]
-            draw.text(
-                (column_x + params.bubble_radius + 4, center_y - text_h / 2),
-                text,
-                fill="black",
-                font=font,
-            )
+    # Rasterise every bubble outline into one mask and blit it onto the page at once.
+    bubble_mask = np.zeros((params.page_height, params.page_width), dtype=bool)
+    ring = _ring_tile(params.bubble_radius)
+    digit_ys = label_start_y + np.arange(10) * params.bubbles_gap
+    text_offset_x = params.bubble_radius + 4
+
+    column_xs = label_start_x + np.arange(params.num_digits) * params.labels_gap
+    _draw_bubble_columns(image, bubble_mask, ring, column_xs, digit_ys, text_offset_x)
 
     if params.include_class and params.class_digits > 0:
+        class_labels = [f"class{col + 1}" for col in range(params.class_digits)]
         class_start_x = label_start_x + params.num_digits * params.labels_gap + params.labels_gap
-        for col in range(params.class_digits):
-            label = f"class{col + 1}"
-            class_labels.append(label)
-            column_x = class_start_x + col * params.labels_gap
-            for digit in range(10):
-                center_y = label_start_y + digit * params.bubbles_gap
-                bbox = [
-                    column_x - params.bubble_radius,
-                    center_y - params.bubble_radius,
-                    column_x + params.bubble_radius,
-                    center_y + params.bubble_radius,
-                ]
-                draw.ellipse(bbox, outline="black", width=2)
-                text = str(digit)
-                bbox_text = draw.textbbox((0, 0), text, font=font)
-                text_w, text_h = bbox_text[2] - bbox_text[0], bbox_text[3] - bbox_text[1]
-                draw.text(
-                    (column_x + params.bubble_radius + 4, center_y - text_h / 2),
-                    text,
-                    fill="black",
-                    font=font,
-                )
+        column_xs = class_start_x + np.arange(params.class_digits) * params.labels_gap
+        _draw_bubble_columns(image, bubble_mask, ring, column_xs, digit_ys, text_offset_x)
+
+    image.paste(0, mask=Image.fromarray(bubble_mask.astype(np.uint8) * 255))
 
     # Place markers around the bubble region (fill region's four corners).
     if total_columns > 0:
         region_x1 = region_x0 + region_width
         region_y1 = region_y0 + region_height
+        left_x = int(round(region_x0 - gap - marker_w))
+        top_y = int(round(region_y0 - gap - marker_h))
+        right_x = int(round(region_x1 + gap))
+        bottom_y = int(round(region_y1 + gap))
 
-        positions = [
-            (int(round(region_x0 - gap - marker_w)), int(round(region_y0 - gap - marker_h))),
-            (int(round(region_x1 + gap)), int(round(region_y0 - gap - marker_h))),
-            (int(round(region_x0 - gap - marker_w)), int(round(region_y1 + gap))),
-            (int(round(region_x1 + gap)), int(round(region_y1 + gap))),
-        ]
-
-        for x, y in positions:
-            image.paste(marker, (x, y))
+        frame, frame_mask = _marker_frame(
+            marker_w, marker_h, right_x - left_x, bottom_y - top_y
+        )
+        image.paste(frame, (left_x, top_y), frame_mask)
 
     return image, labels, class_labels, label_start_x, label_start_y, marker_w, marker_h
@@ -0,0 +1,40 @@
+"""JSON helpers shared by the GUI models, using orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON from raw bytes, skipping a separate str decode step."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(path: Path) -> Any:
+    """Read and parse the JSON file at path."""
+    return loads(path.read_bytes())
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON bytes.
+
+    Non-ASCII text is written as raw UTF-8 and dict keys must be strings, so
+    the output is the same whether or not orjson is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def write_json(path: Path, data: Any) -> None:
+    """Write data to path as indented JSON."""
+    path.write_bytes(dumps(data))
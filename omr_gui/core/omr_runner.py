@@ -8,6 +8,9 @@ import subprocess
 from pathlib import Path
 from typing import List, Optional
 
+# Bytes read from the child's stdout pipe per syscall.
+_READ_CHUNK_SIZE = 65536
+
 
 class OmrRunner:
     """Runs the external OMRChecker process."""
@@ -16,11 +19,28 @@ class OmrRunner:
         self.omrchecker_root = Path(omrchecker_root)
         self.outputs_dir = self.omrchecker_root / "outputs"
 
-    def _latest_output_csv(self) -> Optional[Path]:
-        files = self.list_output_csvs()
-        if not files:
-            return None
-        return max(files, key=lambda f: f.stat().st_mtime)
+    def latest_output_csv(self) -> Optional[Path]:
+        """Return the most recently modified CSV under the outputs directory."""
+        # Single scandir walk: DirEntry caches its stat, and only names ending
+        # in .csv are ever turned into Path objects.
+        latest: Optional[Path] = None
+        latest_mtime = -1.0
+        pending = [str(self.outputs_dir)]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith(".csv"):
+                        mtime = entry.stat().st_mtime
+                        if mtime > latest_mtime:
+                            latest_mtime = mtime
+                            latest = Path(entry.path)
+        return latest
 
     def run(
         self,
@@ -42,36 +62,49 @@ class OmrRunner:
 
         # Optional arguments are reserved for future versions of OMRChecker.
         # We still propagate them via environment variables for potential consumers.
+        # The child inherits our environment as-is (env=None) unless one is set.
         env = None
-        if any([template_path, config_path, evaluation_path]):
-            env = {**os.environ}
-            if template_path:
-                env["OMR_TEMPLATE_PATH"] = str(template_path)
-            if config_path:
-                env["OMR_CONFIG_PATH"] = str(config_path)
-            if evaluation_path:
-                env["OMR_EVALUATION_PATH"] = str(evaluation_path)
+        if template_path or config_path or evaluation_path:
+            env = os.environ.copy()
+            env.update(
+                (name, str(value))
+                for name, value in (
+                    ("OMR_TEMPLATE_PATH", template_path),
+                    ("OMR_CONFIG_PATH", config_path),
+                    ("OMR_EVALUATION_PATH", evaluation_path),
+                )
+                if value
+            )
 
         process = subprocess.Popen(
             cmd,
             cwd=self.omrchecker_root,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
+            bufsize=0,
             env=env,
         )
 
+        # Pump raw bytes in large chunks and split lines ourselves instead of
+        # paying a read + decode per line through a line-buffered text wrapper.
         assert process.stdout is not None
-        for line in process.stdout:
-            if log_callback:
-                log_callback(line.rstrip("\n"))
+        stdout_fd = process.stdout.fileno()
+        pending = b""
+        while chunk := os.read(stdout_fd, _READ_CHUNK_SIZE):
+            if not log_callback:
+                continue
+            *lines, pending = (pending + chunk).split(b"\n")
+            for line in lines:
+                log_callback(line.rstrip(b"\r").decode("utf-8", "replace"))
+        process.stdout.close()
+        if log_callback and pending:
+            log_callback(pending.rstrip(b"\r").decode("utf-8", "replace"))
 
         process.wait()
         if process.returncode != 0:
             raise RuntimeError(f"OMRChecker exited with code {process.returncode}")
 
-        latest_csv = self._latest_output_csv()
+        latest_csv = self.latest_output_csv()
         if not latest_csv:
             raise FileNotFoundError("No CSV outputs were found after running OMRChecker")
         return latest_csv
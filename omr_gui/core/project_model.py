@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
+from .json_io import read_json, write_json
 
-@dataclass
+# Parsed projects keyed by path, tagged with the (mtime_ns, size) they were read at.
+_PROJECT_CACHE: Dict[str, Tuple[int, int, "Project"]] = {}
+
+
+@dataclass(slots=True)
 class Project:
     """Encapsulates user project settings."""
 
@@ -22,9 +26,18 @@ class Project:
 
     @classmethod
     def load(cls, path: Path) -> "Project":
-        """Load a project definition from a JSON file."""
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return cls.from_dict(data)
+        """Load a project definition from a JSON file.
+
+        Re-reading an unchanged file is served from a cache keyed by mtime and size.
+        """
+        stat = path.stat()
+        key = str(path)
+        cached = _PROJECT_CACHE.get(key)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return replace(cached[2])
+        project = cls.from_dict(read_json(path))
+        _PROJECT_CACHE[key] = (stat.st_mtime_ns, stat.st_size, project)
+        return replace(project)
 
     @classmethod
     def from_dict(cls, data: dict) -> "Project":
@@ -58,4 +71,4 @@ class Project:
     def save(self, path: Path) -> None:
         """Persist the project definition to disk."""
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        write_json(path, self.to_dict())
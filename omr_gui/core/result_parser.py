@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
+import csv
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List
 
-import pandas as pd
 
-
-@dataclass
+@dataclass(slots=True)
 class OmrRecord:
     """Single row extracted from an OMR result CSV."""
 
@@ -24,22 +23,23 @@ def parse_omr_csv(
     student_id_column: str = "StudentID",
     class_column: str = "Class",
 ) -> List[OmrRecord]:
-    """Parse a CSV file into a list of OmrRecord objects."""
-    df = pd.read_csv(csv_path)
-    records: List[OmrRecord] = []
-    for _, row in df.iterrows():
-        row_dict = row.to_dict()
-        image_name = str(
-            row_dict.get("image_name") or row_dict.get("image") or ""
-        ).strip()
-        student_id = str(row_dict.get(student_id_column, "") or "").strip()
-        class_code = str(row_dict.get(class_column, "") or "").strip()
-        records.append(
+    """Parse a CSV file into a list of OmrRecord objects.
+
+    ``raw_row`` values are always ``str``; missing cells are ``""`` rather than
+    the int/float/NaN values the earlier pandas-based parser produced.
+    """
+    # Stream rows with the stdlib reader; only a few string columns are needed,
+    # so building a DataFrame first would just double the allocations.
+    # utf-8-sig drops the BOM Excel writes, which would otherwise stick to the
+    # first header name.
+    with open(csv_path, newline="", encoding="utf-8-sig") as handle:
+        reader = csv.DictReader(handle, restval="")
+        return [
             OmrRecord(
-                image_name=image_name,
-                student_id=student_id,
-                class_code=class_code,
-                raw_row=row_dict,
+                image_name=(row.get("image_name") or row.get("image") or "").strip(),
+                student_id=(row.get(student_id_column) or "").strip(),
+                class_code=(row.get(class_column) or "").strip(),
+                raw_row=row,
             )
-        )
-    return records
+            for row in reader
+        ]
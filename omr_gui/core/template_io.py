@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import json
+import copy
 import re
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Tuple
 
+from .json_io import read_json, write_json
 from .template_model import (
     CustomLabelGroup,
     FieldBlock,
@@ -31,17 +32,24 @@ FIELD_TYPE_TO_OMR = {
 }
 
 
+# Parsed templates keyed by path, tagged with the (mtime_ns, size) they were read at.
+_TEMPLATE_CACHE: Dict[str, Tuple[int, int, TemplateModel]] = {}
+
+LABEL_RANGE_PATTERN = re.compile(r"([a-zA-Z_]+)(\d+)\.\.(\d+)")
+
+
 def _expand_labels(labels: Iterable[str]) -> List[str]:
     expanded: List[str] = []
     for label in labels:
-        match = re.match(r"([a-zA-Z_]+)(\d+)\.\.(\d+)", label)
+        match = LABEL_RANGE_PATTERN.match(label) if ".." in label else None
         if match:
             prefix, start, end = match.groups()
             start_idx = int(start)
             end_idx = int(end)
             step = 1 if end_idx >= start_idx else -1
-            for idx in range(start_idx, end_idx + step, step):
-                expanded.append(f"{prefix}{idx}")
+            expanded.extend(
+                f"{prefix}{idx}" for idx in range(start_idx, end_idx + step, step)
+            )
         else:
             expanded.append(label)
     return expanded
@@ -58,8 +66,22 @@ def _map_field_type_to_omr(field_type: FieldType) -> str:
 
 
 def load_template(path: Path) -> TemplateModel:
-    """Load a template.json file into a TemplateModel."""
-    raw = json.loads(path.read_text(encoding="utf-8"))
+    """Load a template.json file into a TemplateModel.
+
+    Re-reading an unchanged file is served from a cache keyed by mtime and size;
+    callers always get their own copy, so they are free to mutate it.
+    """
+    stat = path.stat()
+    key = str(path)
+    cached = _TEMPLATE_CACHE.get(key)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return copy.deepcopy(cached[2])
+    model = _parse_template(read_json(path))
+    _TEMPLATE_CACHE[key] = (stat.st_mtime_ns, stat.st_size, model)
+    return copy.deepcopy(model)
+
+
+def _parse_template(raw: dict) -> TemplateModel:
     page_dimensions = raw.get("pageDimensions") or raw.get("page_dimensions") or [0, 0]
     page = PageSettings(width=int(page_dimensions[0]), height=int(page_dimensions[1]))
     bubble_dims = raw.get("bubbleDimensions")
@@ -126,4 +148,4 @@ def save_template(model: TemplateModel, path: Path) -> None:
         data["bubbleDimensions"] = [model.bubble_dimensions[0], model.bubble_dimensions[1]]
 
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    write_json(path, data)
@@ -8,7 +8,7 @@ from typing import Any, List, Literal
 FieldType = Literal["INT", "MCQ4", "MCQ5", "BOOLEAN"]
 
 
-@dataclass
+@dataclass(slots=True)
 class PageSettings:
     """Page dimensions for a template."""
 
@@ -16,7 +16,7 @@ class PageSettings:
     height: int
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldBlock:
     """Represents a single OMR field block."""
 
@@ -29,7 +29,7 @@ class FieldBlock:
     bubbles_gap: float
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomLabelGroup:
     """Groups labels into a logical column."""
 
@@ -37,7 +37,7 @@ class CustomLabelGroup:
     component_labels: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class TemplateModel:
     """Complete template definition."""
 
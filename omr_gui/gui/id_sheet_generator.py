@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import functools
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import product
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, NamedTuple, Optional
 
-from PIL import ImageDraw
-from PIL.ImageQt import ImageQt
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap
+from PIL import Image, ImageDraw
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QImage, QPixmap
 from PySide6.QtWidgets import (
     QCheckBox,
     QFileDialog,
@@ -34,12 +37,131 @@ from omr_gui.core.id_sheet_generator import (
 )
 
 
+# The sheet's digit glyphs and minimum marker sizes are fixed in pixels, so
+# the preview is rendered at full size and then shrunk by a whole factor
+# (Image.reduce box-filters in one pass) rather than drawn from scaled lengths.
+def _preview_reduce_factor(scale: float) -> int:
+    """Largest integer downsampling that still covers ``scale`` of the page."""
+    return max(1, int(1.0 / scale)) if scale > 0 else 1
+
+
+# Preview images are "L" (plain sheet) or "RGB" (overlay); wrap their raw
+# bytes directly instead of round-tripping through ImageQt.
+_QIMAGE_FORMATS = {"L": QImage.Format_Grayscale8, "RGB": QImage.Format_RGB888}
+_QIMAGE_BYTES_PER_PIXEL = {"L": 1, "RGB": 3}
+
+_PIXMAP_CACHE_SIZE = 8
+# Viewport sizes are rounded down to this many pixels so resize jitter hits the cache.
+_VIEWPORT_BUCKET = 16
+
+# Resize events and no-op spin ticks re-request identical previews; the
+# rendered pages are small enough to keep a handful around.
+_render_cached = functools.lru_cache(maxsize=8)(render_sheet_image)
+
+
+@functools.lru_cache(maxsize=16)
+def _overlay_bubble_stamp(
+    radius: int, color: tuple[int, int, int, int] = (255, 0, 0, 255), width: int = 2
+) -> Image.Image:
+    """One opaque overlay bubble outline, pasted at every bubble centre.
+
+    Only the radius changes between previews, so tweaking any other
+    parameter reuses the rasterized stamp.
+    """
+    size = 2 * radius + 1
+    stamp = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    ImageDraw.Draw(stamp).ellipse((0, 0, size - 1, size - 1), outline=color, width=width)
+    return stamp
+
+
+class _OverlayGeometry(NamedTuple):
+    crop_box: tuple[int, int, int, int]
+    region_width: int
+    region_height: int
+    origin_x: int
+    origin_y: int
+
+
+@functools.lru_cache(maxsize=16)
+def _overlay_geometry(params: IdSheetParams) -> _OverlayGeometry:
+    """Crop box and bubble origin of the overlay, in page and crop coordinates."""
+    _image, _labels, _class_labels, label_start_x, label_start_y, marker_w, marker_h = (
+        _render_cached(params)
+    )
+    bubble_radius = params.bubble_radius
+    gap = max(0, int(params.marker_gap))
+    total_columns = params.num_digits + (params.class_digits if params.include_class else 0)
+    extra_class_gap = params.labels_gap if (params.include_class and params.class_digits > 0) else 0
+    region_width = max(
+        0,
+        (total_columns - 1) * params.labels_gap + extra_class_gap + 2 * bubble_radius,
+    )
+    region_height = max(0, 9 * params.bubbles_gap + 2 * bubble_radius)
+
+    region_x0 = int(round(label_start_x - bubble_radius))
+    region_y0 = int(round(label_start_y - bubble_radius))
+    left_cx = int(round(region_x0 - gap - marker_w // 2))
+    top_cy = int(round(region_y0 - gap - marker_h // 2))
+    warped_w = int(round(region_width + 2 * gap + marker_w))
+    warped_h = int(round(region_height + 2 * gap + marker_h))
+
+    return _OverlayGeometry(
+        crop_box=(left_cx, top_cy, left_cx + warped_w, top_cy + warped_h),
+        region_width=region_width,
+        region_height=region_height,
+        origin_x=marker_w // 2 + gap + bubble_radius,
+        origin_y=marker_h // 2 + gap + bubble_radius,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _render_preview(params: IdSheetParams, show_overlay: bool) -> Image.Image:
+    """Render the preview image, optionally cropped with the template overlay."""
+    image = _render_cached(params)[0]
+    if not show_overlay:
+        return image
+
+    bubble_radius = params.bubble_radius
+    geometry = _overlay_geometry(params)
+    origin_x, origin_y = geometry.origin_x, geometry.origin_y
+
+    # The overlay inks are opaque, so a 3-byte RGB crop is enough and keeps
+    # the per-refresh allocation a quarter smaller than RGBA. The result is
+    # memoized by _render_preview, so it cannot share a scratch buffer.
+    warped = image.crop(geometry.crop_box).convert("RGB")
+    draw = ImageDraw.Draw(warped)
+
+    rect_x0 = origin_x - bubble_radius
+    rect_y0 = origin_y - bubble_radius
+    rect_x1 = rect_x0 + geometry.region_width
+    rect_y1 = rect_y0 + geometry.region_height
+    draw.rectangle([rect_x0, rect_y0, rect_x1, rect_y1], outline=(0, 128, 255), width=2)
+
+    # Stamp top-left corners; the class block starts one extra gap after the digits.
+    x0 = origin_x - bubble_radius
+    column_xs = [x0 + col * params.labels_gap for col in range(params.num_digits)]
+    if params.include_class and params.class_digits > 0:
+        class_x0 = x0 + (params.num_digits + 1) * params.labels_gap
+        column_xs += [class_x0 + col * params.labels_gap for col in range(params.class_digits)]
+    row_ys = [origin_y - bubble_radius + digit * params.bubbles_gap for digit in range(10)]
+
+    stamp = _overlay_bubble_stamp(bubble_radius)
+    for position in product(column_xs, row_ys):
+        warped.paste(stamp, position, stamp)
+
+    return warped
+
+
 class IdSheetGeneratorWindow(QMainWindow):
     """Window to configure and generate ID sheets."""
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self.setWindowTitle("ID Sheet Generator")
+        self._suspend_preview = False
+        # Set when a preview was skipped while the window was hidden or minimized.
+        self._preview_dirty = False
+        self._last_rendered_params: Optional[IdSheetParams] = None
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -80,9 +202,7 @@ class IdSheetGeneratorWindow(QMainWindow):
         self.class_digits.setRange(1, 10)
         self.class_digits.setValue(2)
         self.class_digits.setEnabled(False)
-        self.include_class.stateChanged.connect(
-            lambda state: self.class_digits.setEnabled(bool(state))
-        )
+        self.include_class.toggled.connect(self.class_digits.setEnabled)
 
         self.output_dir = QLineEdit(str(Path.cwd()))
         browse_output = QPushButton("Browse")
@@ -140,42 +260,60 @@ class IdSheetGeneratorWindow(QMainWindow):
 
         self.setCentralWidget(container)
 
-        # Live preview on parameter changes
-        for spin in (
-            self.num_digits,
-            self.page_width,
-            self.page_height,
-            self.margin_left,
-            self.margin_top,
-            self.bubble_radius,
-            self.labels_gap,
-            self.bubbles_gap,
-            self.marker_gap,
-            self.class_digits,
-        ):
-            spin.valueChanged.connect(self._update_preview)
-        self.show_template_overlay.stateChanged.connect(self._update_preview)
-        self.include_class.stateChanged.connect(self._update_preview)
-        self.base_name.textChanged.connect(self._update_preview)
-        # refresh on scroll area resize
+        # Live preview on parameter changes, coalesced so a held spin arrow or
+        # a splitter drag renders once after the input settles.
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(80)
+        self._preview_timer.timeout.connect(self._update_preview)
+        # Interactive rescales use nearest-neighbour; the smooth pass runs once idle.
+        self._hq_timer = QTimer(self)
+        self._hq_timer.setSingleShot(True)
+        self._hq_timer.setInterval(150)
+        self._hq_timer.timeout.connect(self._rescale_hq)
+        with self._batch_preview():
+            for spin in (
+                self.num_digits,
+                self.page_width,
+                self.page_height,
+                self.margin_left,
+                self.margin_top,
+                self.bubble_radius,
+                self.labels_gap,
+                self.bubbles_gap,
+                self.marker_gap,
+                self.class_digits,
+            ):
+                spin.valueChanged.connect(self._schedule_preview)
+            self.show_template_overlay.stateChanged.connect(self._schedule_preview)
+            self.include_class.stateChanged.connect(self._schedule_preview)
+            self.base_name.textChanged.connect(self._schedule_preview)
+        # rescale the last rendered page on scroll area resize
+        self._cached_pixmap: Optional[QPixmap] = None
+        # Smoothly scaled pixmaps keyed by (params, overlay, viewport bucket).
+        self._pixmap_cache: OrderedDict[tuple, tuple[QPixmap, QPixmap]] = OrderedDict()
+        self._current_key: Optional[tuple[IdSheetParams, bool, int]] = None
+        # Bucketed viewport size the label's pixmap was last scaled to.
+        self._last_scaled_bucket: Optional[tuple[int, int]] = None
+        self._preview_reduce = 1
         original_resize = self.preview_scroll.resizeEvent
 
         def resize_event(event):
-            self._update_preview()
             original_resize(event)
+            if self._viewport_reduce_factor() != self._preview_reduce:
+                self._schedule_preview()
+            self._rescale_to_viewport()
 
         self.preview_scroll.resizeEvent = resize_event  # type: ignore[assignment]
 
-        self._update_preview()
-
     def _browse_output_dir(self) -> None:
         directory = QFileDialog.getExistingDirectory(self, "Select Output Directory")
         if directory:
             self.output_dir.setText(directory)
             self._update_preview()
 
-    def _generate(self) -> None:
-        params = IdSheetParams(
+    def _current_params(self) -> IdSheetParams:
+        return IdSheetParams(
             num_digits=self.num_digits.value(),
             page_width=self.page_width.value(),
             page_height=self.page_height.value(),
@@ -188,6 +326,9 @@ class IdSheetGeneratorWindow(QMainWindow):
             include_class=self.include_class.isChecked(),
             class_digits=self.class_digits.value(),
         )
+
+    def _generate(self) -> None:
+        params = self._current_params()
         output_dir = Path(self.output_dir.text())
         base_name = self.base_name.text() or "student_id"
         try:
@@ -201,111 +342,152 @@ class IdSheetGeneratorWindow(QMainWindow):
             "Generated",
             f"Project: {sheet.project_path}\nImage: {sheet.image_path}\nTemplate: {sheet.template_path}\nConfig: {sheet.config_path}",
         )
-        self._update_preview()
+        if params == self._last_rendered_params:
+            return
+        if self.show_template_overlay.isChecked():
+            self._update_preview()
+        else:
+            # The sheet was just written to disk; show it rather than re-rendering.
+            self._show_preview(sheet.image_path)
+            self._last_rendered_params = params
 
     def _show_preview(self, image_path: Path) -> None:
         pixmap = QPixmap(str(image_path))
         if pixmap.isNull():
             self.preview_label.setText(f"Failed to load preview: {image_path}")
             return
-        # scale to fit scroll area width while keeping aspect ratio
-        vw = self.preview_scroll.viewport().width() if self.preview_scroll else self.preview_label.width()
-        vh = self.preview_scroll.viewport().height() if self.preview_scroll else self.preview_label.height()
-        if vw <= 0:
-            vw = 400
-        if vh <= 0:
-            vh = 400
-        scaled = pixmap.scaled(vw, vh, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.preview_label.setPixmap(scaled)
-        self.preview_label.setText("")
+        # Not keyed by preview params, so its rescales stay out of the pixmap cache.
+        self._current_key = None
+        self._cached_pixmap = pixmap
+        self._last_scaled_bucket = None
+        self._rescale_to_viewport()
+
+    def _schedule_preview(self, *_args) -> None:
+        # Signal payloads are dropped: QTimer.start(int) would treat them as an interval.
+        self._preview_timer.start()
+
+    @contextmanager
+    def _batch_preview(self) -> Iterator[None]:
+        """Suppress previews while several fields change, then schedule one."""
+        self._suspend_preview = True
+        try:
+            yield
+        finally:
+            self._suspend_preview = False
+        self._schedule_preview()
+
+    def _preview_hidden(self) -> bool:
+        if self.isVisible() and not self.isMinimized():
+            return False
+        self._preview_dirty = True
+        return True
 
     def _update_preview(self) -> None:
-        params = IdSheetParams(
-            num_digits=self.num_digits.value(),
-            page_width=self.page_width.value(),
-            page_height=self.page_height.value(),
-            margin_left=self.margin_left.value(),
-            margin_top=self.margin_top.value(),
-            bubble_radius=self.bubble_radius.value(),
-            labels_gap=self.labels_gap.value(),
-            bubbles_gap=self.bubbles_gap.value(),
-            marker_gap=self.marker_gap.value(),
-            include_class=self.include_class.isChecked(),
-            class_digits=self.class_digits.value(),
-        )
+        if self._suspend_preview or self._preview_hidden():
+            return
+        self._current_key = self._preview_key()
+        if self._show_cached_scaled():
+            return
+        self._rerender_pixmap(self._current_key)
+        self._rescale_to_viewport()
+
+    def _preview_key(self) -> tuple[IdSheetParams, bool, int]:
+        params = self._current_params()
+        self._last_rendered_params = params
+        show_overlay = self.show_template_overlay.isChecked()
+        # The overlay crop is inspected for alignment, so it stays at full resolution.
+        self._preview_reduce = 1 if show_overlay else self._viewport_reduce_factor()
+        return params, show_overlay, self._preview_reduce
+
+    def _rerender_pixmap(self, key: tuple[IdSheetParams, bool, int]) -> None:
+        params, show_overlay, reduce_factor = key
         try:
-            (
-                image,
-                _labels,
-                _class_labels,
-                label_start_x,
-                label_start_y,
-                marker_w,
-                marker_h,
-            ) = render_sheet_image(params)
+            image = _render_preview(params, show_overlay)
+            if reduce_factor > 1:
+                image = image.reduce(reduce_factor)
         except Exception as exc:  # pragma: no cover
+            self._cached_pixmap = None
             self.preview_label.setText(f"Preview error: {exc}")
             self.preview_label.setPixmap(QPixmap())
             return
 
-        if self.show_template_overlay.isChecked():
-            bubble_radius = params.bubble_radius
-            gap = max(0, int(params.marker_gap))
-            total_columns = params.num_digits + (params.class_digits if params.include_class else 0)
-            extra_class_gap = params.labels_gap if (params.include_class and params.class_digits > 0) else 0
-            region_width = max(
-                0,
-                (total_columns - 1) * params.labels_gap + extra_class_gap + 2 * bubble_radius,
-            )
-            region_height = max(0, 9 * params.bubbles_gap + 2 * bubble_radius)
-
-            region_x0 = int(round(label_start_x - bubble_radius))
-            region_y0 = int(round(label_start_y - bubble_radius))
-            left_cx = int(round(region_x0 - gap - marker_w // 2))
-            top_cy = int(round(region_y0 - gap - marker_h // 2))
-            warped_w = int(round(region_width + 2 * gap + marker_w))
-            warped_h = int(round(region_height + 2 * gap + marker_h))
-
-            warped = image.crop((left_cx, top_cy, left_cx + warped_w, top_cy + warped_h)).convert(
-                "RGBA"
-            )
-            draw = ImageDraw.Draw(warped, "RGBA")
-
-            origin_x = marker_w // 2 + gap + bubble_radius
-            origin_y = marker_h // 2 + gap + bubble_radius
-
-            rect_x0 = origin_x - bubble_radius
-            rect_y0 = origin_y - bubble_radius
-            rect_x1 = rect_x0 + region_width
-            rect_y1 = rect_y0 + region_height
-            draw.rectangle([rect_x0, rect_y0, rect_x1, rect_y1], outline=(0, 128, 255, 200), width=2)
-
-            def draw_int_columns(start_x: int, num_cols: int) -> None:
-                for col in range(num_cols):
-                    cx = start_x + col * params.labels_gap
-                    for digit in range(10):
-                        cy = origin_y + digit * params.bubbles_gap
-                        draw.ellipse(
-                            [cx - bubble_radius, cy - bubble_radius, cx + bubble_radius, cy + bubble_radius],
-                            outline=(255, 0, 0, 200),
-                            width=2,
-                        )
-
-            draw_int_columns(origin_x, params.num_digits)
-            if params.include_class and params.class_digits > 0:
-                class_start_x = origin_x + params.num_digits * params.labels_gap + params.labels_gap
-                draw_int_columns(class_start_x, params.class_digits)
-
-            image = warped.convert("RGB")
-
-        qt_image = ImageQt(image)
-        pixmap = QPixmap.fromImage(qt_image)
+        # QPixmap.fromImage copies the pixels, so the borrowed buffer only has
+        # to outlive this call.
+        buffer = image.tobytes()
+        qt_image = QImage(
+            buffer,
+            image.width,
+            image.height,
+            image.width * _QIMAGE_BYTES_PER_PIXEL[image.mode],
+            _QIMAGE_FORMATS[image.mode],
+        )
+        self._cached_pixmap = QPixmap.fromImage(qt_image)
+        self._last_scaled_bucket = None
+
+    def _rescale_to_viewport(self) -> None:
+        if self._preview_hidden() or self._viewport_size() == self._last_scaled_bucket:
+            return
+        if self._show_cached_scaled():
+            return
+        self._apply_scaled_pixmap(Qt.FastTransformation)
+        self._hq_timer.start()
+
+    def _rescale_hq(self) -> None:
+        scaled = self._apply_scaled_pixmap(Qt.SmoothTransformation)
+        if scaled is None or self._current_key is None:
+            return
+        self._pixmap_cache[self._scaled_cache_key()] = (self._cached_pixmap, scaled)
+        while len(self._pixmap_cache) > _PIXMAP_CACHE_SIZE:
+            self._pixmap_cache.popitem(last=False)
+
+    def _scaled_cache_key(self) -> tuple:
+        vw, vh = self._viewport_size()
+        return self._current_key, vw, vh
+
+    def _show_cached_scaled(self) -> bool:
+        entry = self._pixmap_cache.get(self._scaled_cache_key())
+        if entry is None:
+            return False
+        self._pixmap_cache.move_to_end(self._scaled_cache_key())
+        self._hq_timer.stop()
+        self._cached_pixmap, scaled = entry
+        self._last_scaled_bucket = self._viewport_size()
+        self.preview_label.setPixmap(scaled)
+        self.preview_label.setText("")
+        return True
+
+    def _viewport_size(self) -> tuple[int, int]:
+        """Viewport size rounded down to the pixmap-cache bucket."""
         vw = self.preview_scroll.viewport().width() if self.preview_scroll else self.preview_label.width()
         vh = self.preview_scroll.viewport().height() if self.preview_scroll else self.preview_label.height()
         if vw <= 0:
             vw = 400
         if vh <= 0:
             vh = 400
-        scaled = pixmap.scaled(vw, vh, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        bucket = _VIEWPORT_BUCKET
+        return max(bucket, vw // bucket * bucket), max(bucket, vh // bucket * bucket)
+
+    def _viewport_reduce_factor(self) -> int:
+        vw, vh = self._viewport_size()
+        scale = min(vw / self.page_width.value(), vh / self.page_height.value(), 1.0)
+        return _preview_reduce_factor(scale)
+
+    def _apply_scaled_pixmap(self, mode: Qt.TransformationMode) -> Optional[QPixmap]:
+        if self._cached_pixmap is None:
+            return None
+        vw, vh = self._viewport_size()
+        scaled = self._cached_pixmap.scaled(vw, vh, Qt.KeepAspectRatio, mode)
+        self._last_scaled_bucket = (vw, vh)
         self.preview_label.setPixmap(scaled)
         self.preview_label.setText("")
+        return scaled
+
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        super().showEvent(event)
+        if self._preview_dirty:
+            self._preview_dirty = False
+            self._update_preview()
+
+    def closeEvent(self, event) -> None:  # type: ignore[override]
+        self._pixmap_cache.clear()
+        super().closeEvent(event)
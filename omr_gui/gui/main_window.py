@@ -3,16 +3,29 @@
 from __future__ import annotations
 
 import os
+from collections import deque
 from pathlib import Path
 from typing import Optional
 
-import pandas as pd
-from PySide6.QtCore import Qt, QThread, Signal
-from PySide6.QtGui import QAction, QStandardItem, QStandardItemModel
+import numpy as np
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    Qt,
+    QThread,
+    QThreadPool,
+    QTimer,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import QAction, QFontMetrics
 from PySide6.QtWidgets import (
     QFileDialog,
     QFormLayout,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
     QLineEdit,
     QMainWindow,
@@ -27,10 +40,26 @@ from PySide6.QtWidgets import (
 
 from omr_gui.core.omr_runner import OmrRunner
 from omr_gui.core.project_model import Project
-from omr_gui.core.result_parser import parse_omr_csv
 from omr_gui.gui.id_sheet_generator import IdSheetGeneratorWindow
 from omr_gui.gui.template_editor import TemplateEditorWindow
 
+# Repository root (one level above omr_gui), resolved once at import.
+_DEFAULT_OMR_ROOT = Path(__file__).resolve().parents[2]
+
+# Skip per-entry icon lookups and symlink resolution, which stall the file
+# dialogs on network mounts. Directory pickers keep their ShowDirsOnly default.
+_FAST_DIALOG_OPTS = QFileDialog.DontUseCustomDirectoryIcons | QFileDialog.DontResolveSymlinks
+_FAST_DIR_DIALOG_OPTS = _FAST_DIALOG_OPTS | QFileDialog.ShowDirsOnly
+
+
+def _dir_entries(directory: Path) -> set[str]:
+    """Names in ``directory`` from a single scandir, or empty if unreadable."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
 
 class PathSelector(QWidget):
     """Line edit with a browse button."""
@@ -40,6 +69,9 @@ class PathSelector(QWidget):
         self.select_file = select_file
         self.label_text = label
         self.line_edit = QLineEdit()
+        # Parsed once per edit; path() is read many times per refresh.
+        self._cached_path = Path()
+        self.line_edit.textChanged.connect(self._update_cached_path)
         browse_btn = QPushButton("Browse")
         browse_btn.clicked.connect(self._browse)
 
@@ -50,58 +82,165 @@ class PathSelector(QWidget):
 
     def _browse(self) -> None:
         if self.select_file:
-            file_path, _ = QFileDialog.getOpenFileName(self, f"Select {self.label_text}")
+            file_path, _ = QFileDialog.getOpenFileName(
+                self, f"Select {self.label_text}", options=_FAST_DIALOG_OPTS
+            )
             if file_path:
                 self.line_edit.setText(file_path)
         else:
-            directory = QFileDialog.getExistingDirectory(self, f"Select {self.label_text}")
+            directory = QFileDialog.getExistingDirectory(
+                self, f"Select {self.label_text}", options=_FAST_DIR_DIALOG_OPTS
+            )
             if directory:
                 self.line_edit.setText(directory)
 
+    def _update_cached_path(self, text: str) -> None:
+        self._cached_path = Path(text) if text else Path()
+
     def path(self) -> Path:
-        return Path(self.line_edit.text()) if self.line_edit.text() else Path()
+        return self._cached_path
 
     def set_path(self, path: Path) -> None:
         self.line_edit.setText(str(path))
 
 
-class OmrRunWorker(QThread):
-    """Worker thread to run OMRChecker and stream logs."""
-
-    log_line = Signal(str)
+class DataFrameModel(QAbstractTableModel):
+    """Read-only table model that formats DataFrame cells only when Qt asks."""
+
+    def __init__(self, df=None, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._source_df = self._df = None
+        # Last (column, order) requested by the view; re-applied on reload so
+        # the header's sort indicator keeps matching the rows.
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+        self._cols = np.empty(0, dtype=object)
+        self._values = np.empty((0, 0), dtype=object)
+        if df is not None:
+            self._assign(df)
+
+    def _assign(self, df) -> None:
+        self._source_df = df
+        self._df = df
+        self._cols = df.columns.to_numpy()
+        self._values = df.to_numpy(dtype=object, copy=False)
+        if self._sort_column >= len(self._cols):
+            self._sort_column = -1
+        if self._sort_column >= 0:
+            self._apply_sort()
+
+    def set_dataframe(self, df) -> None:
+        """Swap in a new DataFrame, reusing this model and its view wiring.
+
+        The last sort requested through ``sort`` is re-applied to the new rows.
+        """
+        self.beginResetModel()
+        self._assign(df)
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._values.shape[0]
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._values.shape[1]
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return str(self._values[index.row(), index.column()])
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return str(self._cols[section])
+        return str(section + 1)
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        """Sort with pandas rather than Qt's per-cell QVariant comparisons."""
+        self._sort_column, self._sort_order = column, order
+        if self._source_df is None:
+            return
+        self.layoutAboutToBeChanged.emit()
+        self._apply_sort()
+        self.layoutChanged.emit()
+
+    def _apply_sort(self) -> None:
+        column = self._sort_column
+        if column < 0:
+            self._df = self._source_df
+        else:
+            name = self._source_df.columns[column]
+            ascending = self._sort_order == Qt.AscendingOrder
+            try:
+                self._df = self._source_df.sort_values(name, ascending=ascending, kind="stable")
+            except TypeError:
+                # Mixed-type object columns: fall back to comparing their text.
+                self._df = self._source_df.sort_values(
+                    name, ascending=ascending, kind="stable", key=lambda col: col.astype(str)
+                )
+        self._values = self._df.to_numpy(dtype=object, copy=False)
+
+
+class OmrRunWorker(QObject):
+    """Long-lived worker that runs OMRChecker on its own thread.
+
+    Jobs are queued through ``submit`` so one thread serves every run. Log
+    lines go into ``log_queue`` for the GUI thread to drain on a timer,
+    instead of posting a queued event per line.
+    """
+
+    submit = Signal(object)
     finished = Signal(Path)
     failed = Signal(str)
 
-    def __init__(
-        self,
-        runner: OmrRunner,
-        input_dir: Path,
-        template_path: Optional[Path],
-        config_path: Optional[Path],
-        evaluation_path: Optional[Path],
-    ) -> None:
+    def __init__(self) -> None:
         super().__init__()
-        self.setTerminationEnabled(True)
-        self.runner = runner
-        self.input_dir = input_dir
-        self.template_path = template_path
-        self.config_path = config_path
-        self.evaluation_path = evaluation_path
+        self.log_queue: deque[str] = deque()
+        self.submit.connect(self._run)
 
-    def run(self) -> None:
+    @Slot(object)
+    def _run(self, job: dict) -> None:
         try:
-            latest_csv = self.runner.run(
-                input_dir=self.input_dir,
-                template_path=self.template_path,
-                config_path=self.config_path,
-                evaluation_path=self.evaluation_path,
-                log_callback=self.log_line.emit,
+            latest_csv = job["runner"].run(
+                input_dir=job["input_dir"],
+                template_path=job["template_path"],
+                config_path=job["config_path"],
+                evaluation_path=job["evaluation_path"],
+                log_callback=self.log_queue.append,
             )
             self.finished.emit(latest_csv)
         except Exception as exc:  # pragma: no cover - GUI runtime
             self.failed.emit(str(exc))
 
 
+class CsvLoadSignals(QObject):
+    """Signals for CsvLoadWorker; QRunnable itself cannot emit."""
+
+    loaded = Signal(object)
+    failed = Signal(str)
+
+
+class CsvLoadWorker(QRunnable):
+    """Thread-pool task that parses a results CSV off the GUI thread."""
+
+    def __init__(self, csv_path: Path) -> None:
+        super().__init__()
+        self.csv_path = csv_path
+        self.signals = CsvLoadSignals()
+
+    def run(self) -> None:
+        # pandas is heavy to import; only pay for it once results are viewed.
+        import pandas as pd
+
+        try:
+            df = pd.read_csv(self.csv_path, engine="c", low_memory=False)
+        except Exception as exc:  # pragma: no cover - GUI runtime
+            self.signals.failed.emit(str(exc))
+            return
+        self.signals.loaded.emit(df)
+
+
 class MainWindow(QMainWindow):
     """Main GUI window wrapping OMRChecker."""
 
@@ -110,7 +249,23 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("OMR GUI")
         self.current_project_path: Optional[Path] = None
         self.runner: Optional[OmrRunner] = None
-        self.run_worker: Optional[OmrRunWorker] = None
+        self.run_in_progress = False
+        self._run_thread = QThread(self)
+        self.run_worker = OmrRunWorker()
+        self.run_worker.moveToThread(self._run_thread)
+        self.run_worker.finished.connect(self._on_run_finished, Qt.QueuedConnection)
+        self.run_worker.failed.connect(self._on_run_failed, Qt.QueuedConnection)
+        self._run_thread.start()
+        # Results loads share a pool instead of each spawning a QThread. Pending
+        # loads are referenced here until they report back, and only the
+        # newest one updates the table.
+        self.csv_pool = QThreadPool.globalInstance()
+        self.csv_loads: list[CsvLoadWorker] = []
+        # _paths_from_root results; cleared when the root changes or before
+        # a project is gathered, so runs always see the current files.
+        self._paths_cache: dict[
+            Optional[Path], tuple[Path, Optional[Path], Optional[Path], Path, Path]
+        ] = {}
         self.project_root: Optional[Path] = None
 
         self._build_ui()
@@ -145,6 +300,7 @@ class MainWindow(QMainWindow):
             selector.setVisible(False)
 
         self.paths_summary = QLabel("")
+        self._last_summary = ""
         self.paths_summary.setWordWrap(True)
         form_layout.addRow("Paths", self.paths_summary)
 
@@ -167,9 +323,20 @@ class MainWindow(QMainWindow):
 
         self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
+        # Bound the document so long runs don't slow every append.
+        self.log_output.setMaximumBlockCount(5000)
+        # While a run is active its queued output is appended in one block
+        # every 50 ms, rather than re-laying out the view for every line.
+        self._log_drain_timer = QTimer(self)
+        self._log_drain_timer.setInterval(50)
+        self._log_drain_timer.timeout.connect(self._flush_log)
 
         self.results_table = QTableView()
         self.results_table.horizontalHeader().setStretchLastSection(True)
+        self.results_table.setSortingEnabled(True)
+        # One model for the window's lifetime; reloads swap its DataFrame.
+        self.results_model = DataFrameModel(parent=self.results_table)
+        self.results_table.setModel(self.results_model)
 
         tabs = QTabWidget()
         tabs.addTab(self.log_output, "Log")
@@ -184,8 +351,17 @@ class MainWindow(QMainWindow):
 
         self.setCentralWidget(central)
 
-        # Auto-fill paths when project root changes
-        self.project_root_input.line_edit.textChanged.connect(self._on_project_root_changed)
+        # Auto-fill paths when project root changes. Typed edits wait for the
+        # typing to settle so each keystroke doesn't probe the filesystem;
+        # roots set from code or Browse apply at once, before any project
+        # values that are populated after them.
+        self._root_debounce = QTimer(self)
+        self._root_debounce.setSingleShot(True)
+        self._root_debounce.setInterval(250)
+        self._root_debounce.timeout.connect(self._on_project_root_changed)
+        root_edit = self.project_root_input.line_edit
+        root_edit.textEdited.connect(self._schedule_project_root_changed)
+        root_edit.textChanged.connect(self._on_project_root_set)
 
     def _setup_menu(self) -> None:
         file_menu = self.menuBar().addMenu("File")
@@ -219,15 +395,15 @@ class MainWindow(QMainWindow):
         return runner
 
     def _gather_project(self) -> Project:
-        project_root = self.project_root_input.path()
-        if project_root and project_root.exists():
-            self._auto_fill_from_project_root(project_root)
+        self._paths_cache.clear()
         project_root = self.project_root_input.path()
         if not project_root:
             raise RuntimeError("Please create or open a project first.")
-        template_path, config_path, evaluation_path, input_dir, output_dir = (
-            self._paths_from_root(project_root)
-        )
+        if project_root.exists():
+            paths = self._auto_fill_from_project_root(project_root)
+        else:
+            paths = self._paths_from_root(project_root)
+        template_path, config_path, evaluation_path, input_dir, output_dir = paths
         return Project(
             name=self.name_input.text() or "Untitled",
             omrchecker_root=self.omr_root_input.path() or self._default_omr_root(),
@@ -261,7 +437,7 @@ class MainWindow(QMainWindow):
     def _new_project(self) -> None:
         self.current_project_path = None
         chosen_dir = QFileDialog.getExistingDirectory(
-            self, "Choose Project Folder", str(Path.cwd())
+            self, "Choose Project Folder", str(Path.cwd()), options=_FAST_DIR_DIALOG_OPTS
         )
         if not chosen_dir:
             return
@@ -269,6 +445,7 @@ class MainWindow(QMainWindow):
         default_root.mkdir(parents=True, exist_ok=True)
         for sub in ("config", "input", "output"):
             (default_root / sub).mkdir(parents=True, exist_ok=True)
+        self._paths_cache.clear()
         template_path, config_path, evaluation_path, input_dir, output_dir = (
             self._paths_from_root(default_root)
         )
@@ -294,7 +471,7 @@ class MainWindow(QMainWindow):
 
     def _open_project(self) -> None:
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Open Project", "", "OMR Project (*.omrproj)"
+            self, "Open Project", "", "OMR Project (*.omrproj)", options=_FAST_DIALOG_OPTS
         )
         if not file_path:
             return
@@ -313,7 +490,11 @@ class MainWindow(QMainWindow):
                 else Path.cwd() / f"{project.name}.omrproj"
             )
             file_path, _ = QFileDialog.getSaveFileName(
-                self, "Save Project", str(suggested), "OMR Project (*.omrproj)"
+                self,
+                "Save Project",
+                str(suggested),
+                "OMR Project (*.omrproj)",
+                options=_FAST_DIALOG_OPTS,
             )
             if not file_path:
                 return
@@ -324,7 +505,7 @@ class MainWindow(QMainWindow):
 
     # Actions -------------------------------------------------------------
     def _run_omr(self) -> None:
-        if self.run_worker and self.run_worker.isRunning():
+        if self.run_in_progress:
             QMessageBox.warning(self, "Busy", "OMR is already running.")
             return
         try:
@@ -338,26 +519,35 @@ class MainWindow(QMainWindow):
         self.runner = self._build_runner(project)
         self._prepare_project_files(project)
         self.log_output.appendPlainText("Starting OMRChecker...")
-        self.run_worker = OmrRunWorker(
-            runner=self.runner,
-            input_dir=project.input_dir,
-            template_path=project.template_path,
-            config_path=project.config_path,
-            evaluation_path=project.evaluation_path,
+        self.run_in_progress = True
+        self._log_drain_timer.start()
+        self.run_worker.submit.emit(
+            {
+                "runner": self.runner,
+                "input_dir": project.input_dir,
+                "template_path": project.template_path,
+                "config_path": project.config_path,
+                "evaluation_path": project.evaluation_path,
+            }
         )
-        self.run_worker.log_line.connect(self._append_log)
-        self.run_worker.finished.connect(self._on_run_finished)
-        self.run_worker.failed.connect(self._on_run_failed)
-        self.run_worker.start()
 
-    def _append_log(self, line: str) -> None:
-        self.log_output.appendPlainText(line)
+    def _flush_log(self) -> None:
+        queue = self.run_worker.log_queue
+        lines = [queue.popleft() for _ in range(len(queue))]
+        if lines:
+            self.log_output.appendPlainText("\n".join(lines))
 
     def _on_run_finished(self, csv_path: Path) -> None:
+        self.run_in_progress = False
+        self._log_drain_timer.stop()
+        self._flush_log()
         self.log_output.appendPlainText(f"Run complete. Latest CSV: {csv_path}")
         self._load_results(csv_path)
 
     def _on_run_failed(self, message: str) -> None:
+        self.run_in_progress = False
+        self._log_drain_timer.stop()
+        self._flush_log()
         QMessageBox.critical(self, "Run Failed", message)
         self.log_output.appendPlainText(f"Run failed: {message}")
 
@@ -365,24 +555,57 @@ class MainWindow(QMainWindow):
         if not self.runner:
             QMessageBox.warning(self, "No Runner", "Please configure a project first.")
             return
-        csv_files = self.runner.list_output_csvs()
-        if not csv_files:
+        latest = self.runner.latest_output_csv()
+        if not latest:
             QMessageBox.information(self, "No Results", "No CSV outputs found.")
             return
-        latest = max(csv_files, key=lambda f: f.stat().st_mtime)
         self._load_results(latest)
 
     def _load_results(self, csv_path: Path) -> None:
-        df = pd.read_csv(csv_path)
-        model = QStandardItemModel()
-        model.setHorizontalHeaderLabels(list(df.columns))
-        for _, row in df.iterrows():
-            items = [QStandardItem(str(value)) for value in row]
-            model.appendRow(items)
-        self.results_table.setModel(model)
-        self.results_table.resizeColumnsToContents()
-        # Keep parsed records handy for potential downstream use
-        _ = parse_omr_csv(csv_path)
+        worker = CsvLoadWorker(csv_path)
+        worker.setAutoDelete(False)
+        worker.signals.loaded.connect(self._on_csv_loaded)
+        worker.signals.failed.connect(self._on_csv_failed)
+        self.csv_loads.append(worker)
+        self.csv_pool.start(worker)
+
+    def _finish_csv_load(self) -> bool:
+        """Forget the load that sent the current signal; True if it is the newest."""
+        newest = self.csv_loads[-1].signals is self.sender()
+        self.csv_loads = [w for w in self.csv_loads if w.signals is not self.sender()]
+        return newest
+
+    def _on_csv_loaded(self, df) -> None:
+        if not self._finish_csv_load():
+            return  # superseded by a newer load
+        self.results_model.set_dataframe(df)
+        self._fit_columns_sampled(df)
+
+    def _on_csv_failed(self, message: str) -> None:
+        if not self._finish_csv_load():
+            return
+        QMessageBox.critical(self, "Load Failed", message)
+        self.log_output.appendPlainText(f"Failed to load results: {message}")
+
+    def _fit_columns_sampled(self, df, sample: int = 50) -> None:
+        """Size columns from the header and the first ``sample`` rows only.
+
+        resizeColumnsToContents would stringify every cell, so the cost
+        here stays bounded however long the CSV is.
+        """
+        header = self.results_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setDefaultSectionSize(140)
+        if not len(df.columns):
+            return
+        head = df.head(sample).astype(str)
+        cell_chars = head.apply(lambda column: column.str.len()).max().fillna(0)
+        header_chars = df.columns.astype(str).str.len()
+        chars = np.maximum(cell_chars.to_numpy(), header_chars.to_numpy())
+        char_width = QFontMetrics(self.results_table.font()).averageCharWidth()
+        padding = 2 * char_width
+        for column, width in enumerate(chars):
+            header.resizeSection(column, int(width) * char_width + padding)
 
     def _open_template_editor(self) -> None:
         editor = TemplateEditorWindow(self)
@@ -397,43 +620,57 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event) -> None:  # type: ignore[override]
         """Ensure background threads are stopped before closing."""
-        if self.run_worker and self.run_worker.isRunning():
+        if self.run_in_progress:
             self.log_output.appendPlainText("Waiting for OMR run to stop...")
-            self.run_worker.requestInterruption()
-            self.run_worker.wait(5000)
-            if self.run_worker.isRunning():
-                self.log_output.appendPlainText("Force-stopping OMR thread.")
-                self.run_worker.terminate()
-                self.run_worker.wait(1000)
+        self._run_thread.requestInterruption()
+        self._run_thread.quit()
+        if not self._run_thread.wait(5000):
+            self.log_output.appendPlainText("Force-stopping OMR thread.")
+            self._run_thread.terminate()
+            self._run_thread.wait(1000)
+        self.csv_pool.waitForDone()
         super().closeEvent(event)
 
     # Project root helpers -----------------------------------------------
+    def _schedule_project_root_changed(self, *_args) -> None:
+        self._paths_cache.clear()
+        # Signal payloads are dropped: QTimer.start(int) would treat them as an interval.
+        self._root_debounce.start()
+
+    def _on_project_root_set(self, *_args) -> None:
+        if self.project_root_input.line_edit.isModified():
+            return  # Typed by the user; the debounce handles it.
+        self._root_debounce.stop()
+        self._paths_cache.clear()
+        self._on_project_root_changed()
+
     def _on_project_root_changed(self) -> None:
         root = self.project_root_input.path()
+        paths = None
         if root and root.exists():
-            self._auto_fill_from_project_root(root)
+            paths = self._auto_fill_from_project_root(root)
         self.omr_root_input.set_path(self._default_omr_root())
-        self._update_paths_summary()
+        self._update_paths_summary(paths)
 
-    def _auto_fill_from_project_root(self, root: Path) -> None:
+    def _auto_fill_from_project_root(
+        self, root: Path
+    ) -> tuple[Path, Optional[Path], Optional[Path], Path, Path]:
+        """Fill the path fields from ``root`` and return the paths used."""
         self.project_root = root
-        config_dir = root / "config"
-        input_dir = root / "input"
-        output_dir = root / "output"
+        paths = self._paths_from_root(root)
+        template_path, config_path, evaluation_path, input_dir, output_dir = paths
         self.input_dir_input.set_path(input_dir)
         self.output_dir_input.set_path(output_dir)
-        template_path = config_dir / "template.json"
-        config_path = config_dir / "config.json"
-        evaluation_path = config_dir / "evaluation.json"
         self.template_input.set_path(template_path)
-        if config_path.exists():
+        if config_path:
             self.config_input.set_path(config_path)
         else:
             self.config_input.line_edit.clear()
-        if evaluation_path.exists():
+        if evaluation_path:
             self.evaluation_input.set_path(evaluation_path)
         else:
             self.evaluation_input.line_edit.clear()
+        return paths
 
     def _infer_project_root(self, project: Project) -> Optional[Path]:
         candidates = []
@@ -443,12 +680,23 @@ class MainWindow(QMainWindow):
             candidates.append(project.input_dir.parent)
         if project.output_dir.name.lower() in ["output", "outputs"]:
             candidates.append(project.output_dir.parent)
-        for root in candidates:
+        # The candidates usually name the same folder; probe each one once.
+        for root in dict.fromkeys(candidates):
             if root.exists():
                 return root
         return None
 
     def _paths_from_root(self, root: Path | None) -> tuple[Path, Optional[Path], Optional[Path], Path, Path]:
+        cached = self._paths_cache.get(root)
+        if cached is not None:
+            return cached
+        paths = self._probe_paths_from_root(root)
+        self._paths_cache[root] = paths
+        return paths
+
+    def _probe_paths_from_root(
+        self, root: Path | None
+    ) -> tuple[Path, Optional[Path], Optional[Path], Path, Path]:
         base = root if root else Path.cwd()
         config_dir = base / "config"
         input_dir = base / "input"
@@ -456,10 +704,11 @@ class MainWindow(QMainWindow):
         template_path = config_dir / "template.json"
         config_path = config_dir / "config.json"
         evaluation_path = config_dir / "evaluation.json"
+        config_names = _dir_entries(config_dir)
         return (
             template_path,
-            config_path if config_path.exists() else None,
-            evaluation_path if evaluation_path.exists() else None,
+            config_path if config_path.name in config_names else None,
+            evaluation_path if evaluation_path.name in config_names else None,
             input_dir,
             output_dir,
         )
@@ -469,11 +718,12 @@ class MainWindow(QMainWindow):
         project.input_dir.mkdir(parents=True, exist_ok=True)
         project.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def _update_paths_summary(self) -> None:
-        root = self.project_root_input.path()
-        template_path, config_path, evaluation_path, input_dir, output_dir = (
-            self._paths_from_root(root)
-        )
+    def _update_paths_summary(
+        self, paths: Optional[tuple[Path, Optional[Path], Optional[Path], Path, Path]] = None
+    ) -> None:
+        if paths is None:
+            paths = self._paths_from_root(self.project_root_input.path())
+        template_path, config_path, evaluation_path, input_dir, output_dir = paths
         summary_lines = [
             f"Template: {template_path}",
             f"Config: {config_path or 'not found'}",
@@ -481,8 +731,13 @@ class MainWindow(QMainWindow):
             f"Input: {input_dir}",
             f"Output: {output_dir}",
         ]
-        self.paths_summary.setText("\n".join(summary_lines))
+        text = "\n".join(summary_lines)
+        # setText reflows the word-wrapped label even when the text is unchanged.
+        if text == self._last_summary:
+            return
+        self._last_summary = text
+        self.paths_summary.setText(text)
 
     def _default_omr_root(self) -> Path:
         """Default OMRChecker root is the repository root (one level above omr_gui)."""
-        return Path(__file__).resolve().parents[2]
+        return _DEFAULT_OMR_ROOT
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import math
+import re
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
 
-from PySide6.QtCore import QPointF, QRect, QRectF, QSize, QSizeF, Qt, Signal
-from PySide6.QtGui import QAction, QColor, QPainter, QPen, QPixmap
+from PySide6.QtCore import QPoint, QPointF, QRect, QRectF, QSize, Qt, QTimer, Signal
+from PySide6.QtGui import QAction, QBrush, QColor, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import (
     QComboBox,
     QDoubleSpinBox,
@@ -43,6 +47,17 @@ from omr_gui.core.template_model import (
     TemplateModel,
 )
 
+_DIGITS_RE = re.compile(r"\d")
+
+# Bubble rows drawn for each field type; other types get one row per label.
+_ROWS_BY_FIELD_TYPE: Dict[str, int] = {"INT": 10, "MCQ4": 4, "MCQ5": 5, "BOOLEAN": 2}
+
+# Below this many blocks Qt's automatic BSP depth is left alone.
+_BSP_TUNING_MIN_BLOCKS = 32
+
+# Drag/resize geometry is committed to the model at most once per frame (~60Hz).
+_GEOMETRY_FLUSH_MS = 16
+
 
 class TemplateGraphicsView(QGraphicsView):
     """Graphics view with support for drawing rectangles (Ctrl+Drag)."""
@@ -52,8 +67,12 @@ class TemplateGraphicsView(QGraphicsView):
     def __init__(self, scene: QGraphicsScene, parent: Optional[QWidget] = None) -> None:
         super().__init__(scene, parent)
         self.setRenderHint(QPainter.Antialiasing)
+        # Blocks are plain rects whose bounding rects already include the pen,
+        # so the view can skip the antialiasing padding on exposed regions.
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.DontAdjustForAntialiasing, True)
         self._dragging = False
-        self._drag_start = QPointF()
+        self._drag_start = QPoint()
         self._rubber_band = QRubberBand(QRubberBand.Rectangle, self)
 
     def mousePressEvent(self, event):
@@ -63,15 +82,15 @@ class TemplateGraphicsView(QGraphicsView):
             and not self.itemAt(event.pos())
         ):
             self._dragging = True
-            self._drag_start = event.position()
-            self._rubber_band.setGeometry(QRect(self._drag_start.toPoint(), QSize()))
+            self._drag_start = event.position().toPoint()
+            self._rubber_band.setGeometry(QRect(self._drag_start, QSize()))
             self._rubber_band.show()
         else:
             super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
         if self._dragging:
-            rect = QRect(self._drag_start.toPoint(), event.position().toPoint()).normalized()
+            rect = QRect(self._drag_start, event.position().toPoint()).normalized()
             self._rubber_band.setGeometry(rect)
         else:
             super().mouseMoveEvent(event)
@@ -79,10 +98,10 @@ class TemplateGraphicsView(QGraphicsView):
     def mouseReleaseEvent(self, event):
         if self._dragging:
             self._rubber_band.hide()
-            end_pos = event.position()
+            end_pos = event.position().toPoint()
             if (end_pos - self._drag_start).manhattanLength() > 10:
-                scene_start = self.mapToScene(self._drag_start.toPoint())
-                scene_end = self.mapToScene(end_pos.toPoint())
+                scene_start = self.mapToScene(self._drag_start)
+                scene_end = self.mapToScene(end_pos)
                 rect = QRectF(scene_start, scene_end).normalized()
                 self.rect_drawn.emit(rect)
             self._dragging = False
@@ -90,6 +109,19 @@ class TemplateGraphicsView(QGraphicsView):
             super().mouseReleaseEvent(event)
 
 
+@lru_cache(maxsize=1)
+def _block_style() -> tuple[QBrush, QPen, QBrush]:
+    """Brush, pen and grip brush shared by every block item.
+
+    Built on first use rather than at import, once a QApplication exists.
+    """
+    return (
+        QBrush(QColor(80, 140, 255, 60)),
+        QPen(QColor(40, 90, 180), 2, Qt.DashLine),
+        QBrush(QColor(40, 90, 180)),
+    )
+
+
 class FieldBlockItem(QGraphicsRectItem):
     """Graphics item representing a field block."""
 
@@ -101,12 +133,25 @@ class FieldBlockItem(QGraphicsRectItem):
         parent: Optional[QGraphicsItem] = None,
     ) -> None:
         super().__init__(rect, parent)
+        block_brush, block_pen, handle_brush = _block_style()
         self.block_id = block_id
         self.on_geometry_change = on_geometry_change
         self._resizing = False
         self._handle_size = 12
-        self.setBrush(QColor(80, 140, 255, 60))
-        self.setPen(QPen(QColor(40, 90, 180), 2, Qt.DashLine))
+        self._handle_rect = QRectF()
+        # The resize grip is its own child item so Qt caches and composites it
+        # separately instead of the block repainting it as part of one paint().
+        self._handle_item = QGraphicsRectItem(
+            0, 0, self._handle_size, self._handle_size, self
+        )
+        self._handle_item.setBrush(handle_brush)
+        self._handle_item.setPen(Qt.NoPen)
+        # Presses fall through to the block, which owns the resize logic.
+        self._handle_item.setAcceptedMouseButtons(Qt.NoButton)
+        self._handle_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self._update_handle_rect()
+        self.setBrush(block_brush)
+        self.setPen(block_pen)
         self.setFlags(
             QGraphicsRectItem.ItemIsMovable
             | QGraphicsRectItem.ItemIsSelectable
@@ -114,14 +159,23 @@ class FieldBlockItem(QGraphicsRectItem):
             | QGraphicsRectItem.ItemIsFocusable
         )
         self.setAcceptHoverEvents(True)
+        # Moves only translate the cached bitmap instead of re-rasterising the
+        # dashed outline and translucent fill; setRect() invalidates it.
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
+    def setRect(self, *args) -> None:
+        super().setRect(*args)
+        self._update_handle_rect()
+
+    def _update_handle_rect(self) -> None:
+        # Hover hit-testing runs at mouse-move rate; keep the handle rect ready.
+        corner = self.rect().bottomRight()
+        size = self._handle_size
+        self._handle_rect.setRect(corner.x() - size, corner.y() - size, size, size)
+        self._handle_item.setPos(self._handle_rect.topLeft())
 
     def _hit_resize_handle(self, pos: QPointF) -> bool:
-        rect = self.rect()
-        handle_rect = QRectF(
-            rect.bottomRight() - QPointF(self._handle_size, self._handle_size),
-            QSizeF(self._handle_size, self._handle_size),
-        )
-        return handle_rect.contains(pos)
+        return self._handle_rect.contains(pos)
 
     def hoverMoveEvent(self, event):
         if self._hit_resize_handle(event.pos()):
@@ -153,10 +207,13 @@ class FieldBlockItem(QGraphicsRectItem):
         if self._resizing:
             self._resizing = False
             if self.on_geometry_change:
-                self.on_geometry_change(self)
+                self.on_geometry_change(self, flush=True)
             event.accept()
             return
         super().mouseReleaseEvent(event)
+        # Make sure the final position of a drag reaches the model right away.
+        if self.on_geometry_change:
+            self.on_geometry_change(self, flush=True)
 
     def itemChange(self, change, value):
         if (
@@ -178,9 +235,38 @@ class TemplateEditorWindow(QMainWindow):
         self.current_template_path: Optional[Path] = None
         self.background_item: Optional[QGraphicsPixmapItem] = None
         self.block_items: Dict[str, FieldBlockItem] = {}
+        # Lookup indexes over self.model, rebuilt whenever the model is replaced.
+        self._blocks_by_id: Dict[str, FieldBlock] = {}
+        self._groups_by_name: Dict[str, CustomLabelGroup] = {}
+        # Set mirror of each group's component_labels, built on first use.
+        self._group_members: Dict[str, set[str]] = {}
+        # Form prefix (first label with digits stripped), keyed by block id and
+        # dropped whenever that block's labels change.
+        self._label_prefixes: Dict[str, str] = {}
+        # Every block's labels in model order; None until next requested.
+        self._all_labels: Optional[tuple[str, ...]] = None
+        # Labels currently listed in label_memberships, one entry per row.
+        self._membership_labels: tuple[str, ...] = ()
         self._selected_block_id: Optional[str] = None
         self._scale_x = 1.0
         self._scale_y = 1.0
+        # Zero-guarded divisors for scene -> model conversion, kept in step
+        # with the scales so the per-event helpers skip the guard.
+        self._unscale_x = 1.0
+        self._unscale_y = 1.0
+        # Items moved since the last flush, keyed by block id (multi-select drags
+        # move several items at once).
+        self._pending_items: Dict[str, FieldBlockItem] = {}
+        self._geometry_timer = QTimer(self)
+        self._geometry_timer.setSingleShot(True)
+        self._geometry_timer.setInterval(_GEOMETRY_FLUSH_MS)
+        self._geometry_timer.timeout.connect(self._flush_geometry)
+        # Group list rebuilds are coalesced to one per event-loop iteration.
+        self._groups_dirty = False
+        self._groups_timer = QTimer(self)
+        self._groups_timer.setSingleShot(True)
+        self._groups_timer.setInterval(0)
+        self._groups_timer.timeout.connect(self._flush_groups_ui)
 
         self._build_ui()
         self._setup_menu()
@@ -254,7 +340,9 @@ class TemplateEditorWindow(QMainWindow):
 
         tabs = QTabWidget()
         tabs.addTab(block_form, "Block Properties")
-        tabs.addTab(custom_widget, "Custom Labels")
+        self._custom_tab_index = tabs.addTab(custom_widget, "Custom Labels")
+        tabs.currentChanged.connect(self._on_tab_changed)
+        self.tabs = tabs
 
         splitter = QSplitter(self)
         splitter.addWidget(self.view)
@@ -303,27 +391,81 @@ class TemplateEditorWindow(QMainWindow):
         edit_menu.addAction(delete_block_action)
 
     # Model/scene sync -----------------------------------------------------
+    def _rebuild_indexes(self) -> None:
+        self._blocks_by_id = {block.id: block for block in self.model.field_blocks}
+        self._groups_by_name = {group.name: group for group in self.model.custom_labels}
+        self._group_members = {}
+        self._label_prefixes = {}
+        self._all_labels = None
+
+    @contextmanager
+    def _rebuilding_scene(self) -> Iterator[None]:
+        """Drop the block items and let the caller re-add them without per-item overhead."""
+        self._drop_pending_geometry()
+        index_method = self.scene.itemIndexMethod()
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+        self.scene.blockSignals(True)
+        try:
+            # Only block items go; the background pixmap item stays in the scene.
+            for item in self.block_items.values():
+                self.scene.removeItem(item)
+            self.block_items.clear()
+            yield
+        finally:
+            self.scene.blockSignals(False)
+            # Switching back builds the BSP index once for all items.
+            self.scene.setItemIndexMethod(index_method)
+            if index_method == QGraphicsScene.BspTreeIndex:
+                depth = self._bsp_depth_for(len(self.block_items))
+                if depth != self.scene.bspTreeDepth():
+                    self.scene.setBspTreeDepth(depth)
+            # Items were positioned from the model; there is nothing to commit back.
+            self._drop_pending_geometry()
+        if self._selected_block_id is not None:
+            # The selected item left the scene while selectionChanged was blocked.
+            self._on_selection_changed()
+
+    @staticmethod
+    def _bsp_depth_for(block_count: int) -> int:
+        # Dense OMR grids: one tree level per doubling of blocks; 0 means auto.
+        if block_count < _BSP_TUNING_MIN_BLOCKS:
+            return 0
+        return int(math.log2(block_count)) + 1
+
     def _refresh_scene(self) -> None:
-        self.scene.clear()
-        self.block_items.clear()
-        if self.background_item:
-            self.background_item = None
-        self._scale_x = 1.0
-        self._scale_y = 1.0
+        self._rebuild_indexes()
+        self._update_background_scale()
 
         if self.current_template_path:
             self.setWindowTitle(f"Template Editor - {self.current_template_path}")
         else:
             self.setWindowTitle("Template Editor")
 
+        with self._rebuilding_scene():
+            for block in self.model.field_blocks:
+                self._add_block_item(block)
+
         # Update scene rect to page size
         self.scene.setSceneRect(
             QRectF(0, 0, float(self.model.page.width), float(self.model.page.height))
         )
+        self._mark_groups_dirty()
 
-        for block in self.model.field_blocks:
-            self._add_block_item(block)
-        self._refresh_groups_ui()
+    def _update_background_scale(self) -> None:
+        """Map page units onto the background pixmap, or 1:1 without one.
+
+        Templates without page dimensions (0 x 0) also map 1:1.
+        """
+        page = self.model.page
+        if self.background_item is None or page.width <= 0 or page.height <= 0:
+            self._scale_x = 1.0
+            self._scale_y = 1.0
+        else:
+            pixmap = self.background_item.pixmap()
+            self._scale_x = pixmap.width() / page.width
+            self._scale_y = pixmap.height() / page.height
+        self._unscale_x = self._scale_x or 1.0
+        self._unscale_y = self._scale_y or 1.0
 
     def _add_block_item(self, block: FieldBlock) -> FieldBlockItem:
         width = self._block_width(block)
@@ -350,23 +492,14 @@ class TemplateEditorWindow(QMainWindow):
         return rows * gap
 
     def _rows_for_block(self, block: FieldBlock) -> int:
-        if block.field_type == "INT":
-            return 10
-        if block.field_type == "MCQ4":
-            return 4
-        if block.field_type == "MCQ5":
-            return 5
-        if block.field_type == "BOOLEAN":
-            return 2
-        return max(1, len(block.labels))
+        rows = _ROWS_BY_FIELD_TYPE.get(block.field_type)
+        return rows if rows is not None else max(1, len(block.labels))
 
     def _model_to_scene_point(self, x: float, y: float) -> QPointF:
         return QPointF(x * self._scale_x, y * self._scale_y)
 
     def _scene_to_model_point(self, point: QPointF) -> QPointF:
-        scale_x = self._scale_x if self._scale_x else 1.0
-        scale_y = self._scale_y if self._scale_y else 1.0
-        return QPointF(point.x() / scale_x, point.y() / scale_y)
+        return QPointF(point.x() / self._unscale_x, point.y() / self._unscale_y)
 
     def _update_item_from_block(self, block: FieldBlock) -> None:
         item = self.block_items.get(block.id)
@@ -375,7 +508,26 @@ class TemplateEditorWindow(QMainWindow):
         item.setPos(self._model_to_scene_point(block.origin_x, block.origin_y))
         item.setRect(QRectF(0, 0, self._block_width(block), self._block_height(block)))
 
-    def _on_item_geometry_changed(self, item: FieldBlockItem) -> None:
+    def _on_item_geometry_changed(self, item: FieldBlockItem, flush: bool = False) -> None:
+        self._pending_items[item.block_id] = item
+        if flush:
+            self._geometry_timer.stop()
+            self._flush_geometry()
+        elif not self._geometry_timer.isActive():
+            self._geometry_timer.start()
+
+    def _drop_pending_geometry(self) -> None:
+        # Items are about to be deleted with the scene; commit nothing for them.
+        self._geometry_timer.stop()
+        self._pending_items.clear()
+
+    def _flush_geometry(self) -> None:
+        items = list(self._pending_items.values())
+        self._pending_items.clear()
+        for item in items:
+            self._commit_item_geometry(item)
+
+    def _commit_item_geometry(self, item: FieldBlockItem) -> None:
         block = self._get_block_by_id(item.block_id)
         if not block:
             return
@@ -389,16 +541,13 @@ class TemplateEditorWindow(QMainWindow):
             self._populate_block_form(block)
 
     def _get_block_by_id(self, block_id: str) -> Optional[FieldBlock]:
-        for block in self.model.field_blocks:
-            if block.id == block_id:
-                return block
-        return None
+        return self._blocks_by_id.get(block_id)
 
     # Slots ---------------------------------------------------------------
     def _on_rect_drawn(self, rect: QRectF) -> None:
         model_pos = self._scene_to_model_point(rect.topLeft())
-        width = rect.width() / (self._scale_x if self._scale_x else 1.0)
-        height = rect.height() / (self._scale_y if self._scale_y else 1.0)
+        width = rect.width() / self._unscale_x
+        height = rect.height() / self._unscale_y
         block_id = f"Block_{len(self.model.field_blocks) + 1}"
         block = FieldBlock(
             id=block_id,
@@ -407,12 +556,15 @@ class TemplateEditorWindow(QMainWindow):
             origin_x=float(model_pos.x()),
             origin_y=float(model_pos.y()),
             labels_gap=width,
-            bubbles_gap=height / 10 if height > 0 else 30,
+            bubbles_gap=height / _ROWS_BY_FIELD_TYPE["INT"] if height > 0 else 30,
         )
         self.model.field_blocks.append(block)
+        self._all_labels = None
+        self._blocks_by_id[block.id] = block
+        self._label_prefixes.pop(block.id, None)
         self._add_block_item(block)
         self._select_block(block.id)
-        self._refresh_groups_ui()
+        self._mark_groups_dirty()
 
     def _add_default_block(self) -> None:
         rect = QRectF(50, 50, 200, 200)
@@ -441,7 +593,11 @@ class TemplateEditorWindow(QMainWindow):
         self.labels_gap_input.setValue(block.labels_gap)
         self.bubbles_gap_input.setValue(block.bubbles_gap)
         if block.labels:
-            prefix = "".join([c for c in block.labels[0] if not c.isdigit()])
+            prefix = self._label_prefixes.get(block.id)
+            if prefix is None:
+                # Derived once per label change; every label edit drops it.
+                prefix = _DIGITS_RE.sub("", block.labels[0])
+                self._label_prefixes[block.id] = prefix
             self.label_prefix_input.setText(prefix)
             self.label_count_input.setValue(len(block.labels))
 
@@ -460,8 +616,10 @@ class TemplateEditorWindow(QMainWindow):
             prefix = self.label_prefix_input.text()
             count = self.label_count_input.value()
             block.labels = [f"{prefix}{i+1}" for i in range(count)]
+            self._all_labels = None
+            self._label_prefixes.pop(block.id, None)
         self._update_item_from_block(block)
-        self._refresh_groups_ui()
+        self._mark_groups_dirty()
 
     def _regenerate_labels(self) -> None:
         if not self._selected_block_id:
@@ -472,8 +630,10 @@ class TemplateEditorWindow(QMainWindow):
         prefix = self.label_prefix_input.text() or "field"
         count = self.label_count_input.value()
         block.labels = [f"{prefix}{i+1}" for i in range(count)]
+        self._all_labels = None
+        self._label_prefixes.pop(block.id, None)
         self._update_item_from_block(block)
-        self._refresh_groups_ui()
+        self._mark_groups_dirty()
 
     def _delete_selected_block(self) -> None:
         if not self._selected_block_id:
@@ -482,19 +642,41 @@ class TemplateEditorWindow(QMainWindow):
         if not block:
             return
         self.model.field_blocks.remove(block)
+        self._blocks_by_id.pop(block.id, None)
+        self._label_prefixes.pop(block.id, None)
+        self._all_labels = None
         item = self.block_items.pop(block.id, None)
         if item:
             self.scene.removeItem(item)
         self._selected_block_id = None
         self._populate_block_form(None)
-        self._refresh_groups_ui()
+        self._mark_groups_dirty()
 
     # Group UI ------------------------------------------------------------
-    def _collect_all_labels(self) -> list[str]:
-        labels: list[str] = []
-        for block in self.model.field_blocks:
-            labels.extend(block.labels)
-        return labels
+    def _collect_all_labels(self) -> tuple[str, ...]:
+        # Rebuilt only after a block is added, removed or relabelled.
+        if self._all_labels is None:
+            self._all_labels = tuple(
+                label for block in self.model.field_blocks for label in block.labels
+            )
+        return self._all_labels
+
+    def _mark_groups_dirty(self) -> None:
+        self._groups_dirty = True
+        if not self._groups_timer.isActive():
+            self._groups_timer.start()
+
+    def _flush_groups_ui(self) -> None:
+        # While the Custom Labels tab is hidden the flag stays set and the
+        # rebuild waits for _on_tab_changed.
+        if not self._groups_dirty or self.tabs.currentIndex() != self._custom_tab_index:
+            return
+        self._groups_dirty = False
+        self._refresh_groups_ui()
+
+    def _on_tab_changed(self, index: int) -> None:
+        if index == self._custom_tab_index:
+            self._flush_groups_ui()
 
     def _refresh_groups_ui(self) -> None:
         self.group_list.blockSignals(True)
@@ -505,31 +687,45 @@ class TemplateEditorWindow(QMainWindow):
         if self.model.custom_labels:
             self.group_list.setCurrentRow(0)
         else:
-            self.label_memberships.clear()
+            self._clear_label_memberships()
 
     def _on_group_selected(
         self, current: Optional[QListWidgetItem], _previous: Optional[QListWidgetItem]
     ) -> None:
         if not current:
-            self.label_memberships.clear()
+            self._clear_label_memberships()
             return
         group = self._get_group_by_name(current.text())
         if not group:
             return
         self._populate_label_memberships(group)
 
-    def _populate_label_memberships(self, group: CustomLabelGroup) -> None:
-        self.label_memberships.blockSignals(True)
+    def _clear_label_memberships(self) -> None:
         self.label_memberships.clear()
+        self._membership_labels = ()
+
+    def _populate_label_memberships(self, group: CustomLabelGroup) -> None:
         all_labels = self._collect_all_labels()
-        for label in all_labels:
-            item = QListWidgetItem(label)
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-            item.setCheckState(
-                Qt.Checked if label in group.component_labels else Qt.Unchecked
-            )
-            self.label_memberships.addItem(item)
-        self.label_memberships.blockSignals(False)
+        members = self._members_of(group)
+        self.label_memberships.blockSignals(True)
+        try:
+            if all_labels == self._membership_labels:
+                # Same rows as before: only flip the check boxes that differ.
+                for row, label in enumerate(all_labels):
+                    item = self.label_memberships.item(row)
+                    state = Qt.Checked if label in members else Qt.Unchecked
+                    if item.checkState() != state:
+                        item.setCheckState(state)
+                return
+            self.label_memberships.clear()
+            for label in all_labels:
+                item = QListWidgetItem(label)
+                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+                item.setCheckState(Qt.Checked if label in members else Qt.Unchecked)
+                self.label_memberships.addItem(item)
+            self._membership_labels = all_labels
+        finally:
+            self.label_memberships.blockSignals(False)
 
     def _on_label_membership_changed(self, item: QListWidgetItem) -> None:
         group_item = self.group_list.currentItem()
@@ -539,24 +735,34 @@ class TemplateEditorWindow(QMainWindow):
         if not group:
             return
         label = item.text()
+        members = self._members_of(group)
         if item.checkState() == Qt.Checked:
-            if label not in group.component_labels:
+            if label not in members:
                 group.component_labels.append(label)
+                members.add(label)
         else:
-            if label in group.component_labels:
+            if label in members:
                 group.component_labels.remove(label)
+                members.discard(label)
         self.model.output_columns = [g.name for g in self.model.custom_labels]
 
+    def _members_of(self, group: CustomLabelGroup) -> set[str]:
+        members = self._group_members.get(group.name)
+        if members is None:
+            members = self._group_members[group.name] = set(group.component_labels)
+        return members
+
     def _add_group(self) -> None:
         name, ok = QInputDialog.getText(self, "Add Group", "Group name:")
         if not ok or not name:
             return
-        if self._get_group_by_name(name):
+        if name in self._groups_by_name:
             QMessageBox.warning(self, "Duplicate Name", "Group name already exists.")
             return
         group = CustomLabelGroup(name=name, component_labels=[])
         self.model.custom_labels.append(group)
-        self._refresh_groups_ui()
+        self._groups_by_name[group.name] = group
+        self._mark_groups_dirty()
 
     def _remove_group(self) -> None:
         current = self.group_list.currentItem()
@@ -566,14 +772,13 @@ class TemplateEditorWindow(QMainWindow):
         if not group:
             return
         self.model.custom_labels.remove(group)
-        self._refresh_groups_ui()
+        self._groups_by_name.pop(group.name, None)
+        self._group_members.pop(group.name, None)
+        self._mark_groups_dirty()
         self.model.output_columns = [g.name for g in self.model.custom_labels]
 
     def _get_group_by_name(self, name: str) -> Optional[CustomLabelGroup]:
-        for group in self.model.custom_labels:
-            if group.name == name:
-                return group
-        return None
+        return self._groups_by_name.get(name)
 
     # Template load/save ---------------------------------------------------
     def load_template(self, path: Path) -> None:
@@ -615,13 +820,28 @@ class TemplateEditorWindow(QMainWindow):
         if pixmap.isNull():
             QMessageBox.warning(self, "Error", "Failed to load image.")
             return
-        self.scene.clear()
-        self.block_items.clear()
-        self.background_item = self.scene.addPixmap(pixmap)
-        self._scale_x = pixmap.width() / self.model.page.width
-        self._scale_y = pixmap.height() / self.model.page.height
-        for block in self.model.field_blocks:
-            self._add_block_item(block)
+        # Block geometry lives in template page units, so detail beyond the page
+        # size is never used; full-resolution scans would only slow every repaint.
+        # Without page dimensions there is nothing to cap against.
+        page_width, page_height = self.model.page.width, self.model.page.height
+        if (
+            page_width > 0
+            and page_height > 0
+            and (pixmap.width() > page_width or pixmap.height() > page_height)
+        ):
+            pixmap = pixmap.scaled(
+                page_width, page_height, Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
+        with self._rebuilding_scene():
+            if self.background_item is not None:
+                self.scene.removeItem(self.background_item)
+            self.background_item = self.scene.addPixmap(pixmap)
+            self.background_item.setTransformationMode(Qt.SmoothTransformation)
+            # Keep the image under the blocks regardless of insertion order.
+            self.background_item.setZValue(-1)
+            self._update_background_scale()
+            for block in self.model.field_blocks:
+                self._add_block_item(block)
 
     # Utilities -----------------------------------------------------------
     def _get_output_columns(self) -> list[str]:
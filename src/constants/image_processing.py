@@ -35,6 +35,12 @@ MARKER_RECTANGLE_COLOR = (150, 150, 150)
 ERODE_RECT_COLOR = (50, 50, 50)
 NORMAL_RECT_COLOR = (155, 155, 155)
 EROSION_PARAMS = {"kernel_size": (5, 5), "iterations": 5}
+# Marker scales are ranked on a half-resolution pyramid level first; only the
+# best few (and any marker too small to downsample) are matched at full size.
+MARKER_PYRAMID_REFINE_SCALES = 3
+MARKER_PYRAMID_MIN_SIZE = 8
+# Leaders scoring this far below the best coarse match are not refined.
+MARKER_PYRAMID_PRUNE_MARGIN = 0.1
 
 # FeatureBasedAlignment constants
 DEFAULT_MAX_FEATURES = 500
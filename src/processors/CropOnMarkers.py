@@ -1,4 +1,6 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from itertools import combinations
 
 import cv2
@@ -13,6 +15,9 @@ from src.constants.image_processing import (
     DEFAULT_WHITE_COLOR,
     ERODE_RECT_COLOR,
     EROSION_PARAMS,
+    MARKER_PYRAMID_MIN_SIZE,
+    MARKER_PYRAMID_PRUNE_MARGIN,
+    MARKER_PYRAMID_REFINE_SCALES,
     MARKER_RECTANGLE_COLOR,
     NORMAL_RECT_COLOR,
     QUADRANT_DIVISION,
@@ -22,6 +27,101 @@ from src.processors.interfaces.ImagePreprocessor import ImagePreprocessor
 from src.utils.image import ImageUtils
 from src.utils.interaction import InteractionUtils
 
+# Rectangular uint8 kernel shared by every erosion below (same footprint as
+# np.ones(kernel_size), without a float64 array to convert per call).
+# getStructuringElement takes (width, height), np.ones takes (rows, cols).
+_ERODE_KERNEL = cv2.getStructuringElement(
+    cv2.MORPH_RECT, EROSION_PARAMS["kernel_size"][::-1]
+)
+
+
+def _find_marker_candidates(res, w, h, threshold, max_candidates=12):
+    # Greedy non-maximum suppression: take the strongest remaining match and
+    # drop everything within 0.9 marker sizes of it. A cheap 3x3 dilation
+    # first narrows the scan to local maxima (every real marker peak is one);
+    # the stable sort keeps minMaxLoc's raster order among equal scores, so a
+    # flat plateau yields a single candidate.
+    suppress_x = max(1, int(w * 0.9))
+    suppress_y = max(1, int(h * 0.9))
+    local_max = cv2.dilate(res, np.ones((3, 3), np.uint8))
+    ys, xs = np.nonzero((res == local_max) & (res >= threshold))
+    order = np.argsort(-res[ys, xs], kind="stable")
+    picked_x, picked_y = [], []
+    for x, y in zip(xs[order].tolist(), ys[order].tolist()):
+        if any(
+            abs(x - px) <= suppress_x and abs(y - py) <= suppress_y
+            for px, py in zip(picked_x, picked_y)
+        ):
+            continue
+        picked_x.append(x)
+        picked_y.append(y)
+        if len(picked_x) == max_candidates:
+            break
+    return np.array(picked_x, dtype=np.intp), np.array(picked_y, dtype=np.intp)
+
+
+# Prepared markers shared by every processor built from the same file and
+# options, e.g. one per input directory in a batch run. Bounded so a
+# long-running process cycling through templates does not keep them all.
+@lru_cache(maxsize=16)
+def _prepare_marker(
+    marker_path, _mtime, width_ratio, processing_width, apply_erode_subtract
+):
+    marker = cv2.imread(marker_path, cv2.IMREAD_GRAYSCALE)
+
+    if width_ratio is not None:
+        marker = ImageUtils.resize_util(
+            marker,
+            processing_width / int(width_ratio),
+        )
+    marker = cv2.GaussianBlur(
+        marker,
+        DEFAULT_GAUSSIAN_BLUR_PARAMS_MARKER["kernel_size"],
+        DEFAULT_GAUSSIAN_BLUR_PARAMS_MARKER["sigma_x"],
+    )
+    marker = cv2.normalize(
+        marker,
+        None,
+        alpha=DEFAULT_NORMALIZE_PARAMS["alpha"],
+        beta=DEFAULT_NORMALIZE_PARAMS["beta"],
+        norm_type=cv2.NORM_MINMAX,
+    )
+
+    if apply_erode_subtract:
+        marker -= cv2.erode(
+            marker,
+            kernel=_ERODE_KERNEL,
+            iterations=EROSION_PARAMS["iterations"],
+        )
+
+    # Shared between processors, so guard against in-place edits.
+    marker.flags.writeable = False
+    return marker
+
+
+@lru_cache(maxsize=None)
+def _marker_combinations(n):
+    # Index rows of every 4-subset of n candidates, shared across pages.
+    combos = np.array(list(combinations(range(n), 4)))
+    combos.flags.writeable = False
+    return combos
+
+
+@lru_cache(maxsize=1)
+def _scale_search_pool():
+    # One pool for the whole run, created on first use and reused by every
+    # page and processor; None on single-core machines.
+    workers = os.cpu_count() or 1
+    if workers <= 1:
+        return None
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def _match_marker(image, marker):
+    # res is the black image with white dots
+    res = cv2.matchTemplate(image, marker, cv2.TM_CCOEFF_NORMED)
+    return res.max(), res
+
 
 class CropOnMarkers(ImagePreprocessor):
     def __init__(self, *args, **kwargs):
@@ -42,6 +142,12 @@ class CropOnMarkers(ImagePreprocessor):
         )
         self.marker_rescale_steps = int(marker_ops.get("marker_rescale_steps", 10))
         self.apply_erode_subtract = marker_ops.get("apply_erode_subtract", True)
+        # Opt-in contract: the incoming page already spans the full 0-255
+        # range, so the min-max normalize below would be a no-op.
+        self.already_normalized = marker_ops.get("alreadyNormalized", False)
+        # Off by default: matchTemplate already runs on OpenCV's own thread
+        # pool, so splitting scales across threads can oversubscribe cores.
+        self.parallel_scale_search = marker_ops.get("parallelScaleSearch", False)
         self.search_mode = str(
             marker_ops.get(
                 "searchMode",
@@ -49,6 +155,8 @@ class CropOnMarkers(ImagePreprocessor):
             )
         ).lower()
         self.marker = self.load_marker(marker_ops, config)
+        # The marker and scale grid are fixed for the batch: resize once here.
+        self.rescaled_markers, self.coarse_markers = self._build_rescaled_markers()
 
     def __str__(self):
         return self.marker_path
@@ -56,78 +164,63 @@ class CropOnMarkers(ImagePreprocessor):
     def exclude_files(self):
         return [self.marker_path]
 
-    def _get_centres_global(self, image_eroded_sub, optimal_marker, file_path):
+    def _get_centres_global(self, image_eroded_sub, optimal_marker, file_path, res):
         config = self.tuning_config
         _h, w = optimal_marker.shape[:2]
-        res = cv2.matchTemplate(image_eroded_sub, optimal_marker, cv2.TM_CCOEFF_NORMED)
-
-        res_work = res.copy()
-        candidates = []
-        suppress_x = max(1, int(w * 0.9))
-        suppress_y = max(1, int(_h * 0.9))
-        max_candidates = 20
-        for _ in range(max_candidates):
-            _min_val, max_val, _min_loc, max_loc = cv2.minMaxLoc(res_work)
-            if max_val < self.min_matching_threshold:
-                break
-            x, y = int(max_loc[0]), int(max_loc[1])
-            candidates.append((float(max_val), x, y))
-            x0 = max(0, x - suppress_x)
-            y0 = max(0, y - suppress_y)
-            x1 = min(res_work.shape[1] - 1, x + suppress_x)
-            y1 = min(res_work.shape[0] - 1, y + suppress_y)
-            res_work[y0 : y1 + 1, x0 : x1 + 1] = 0
-
-        if len(candidates) < 4:
+
+        cand_x, cand_y = _find_marker_candidates(
+            res, w, _h, self.min_matching_threshold
+        )
+        cand_t = res[cand_y, cand_x].astype(np.float64)
+
+        if len(cand_x) < 4:
             logger.error(file_path, "\nError: Not enough markers found in global search.")
             if config.outputs.show_image_level >= 1:
                 InteractionUtils.show(f"Marker search: {file_path}", image_eroded_sub, 0, config=config)
                 InteractionUtils.show("matchTemplate res", res, 1, config=config)
             return None, None, None
 
-        top_k = candidates[: min(len(candidates), 12)]
-        best = None
-        best_area = None
-        best_score = None
-        for combo in combinations(top_k, 4):
-            centres = np.array(
-                [[x + w / 2, y + _h / 2] for (_t, x, y) in combo], dtype="float32"
-            )
-            area = float(
-                (centres[:, 0].max() - centres[:, 0].min())
-                * (centres[:, 1].max() - centres[:, 1].min())
-            )
-            score = float(sum(t for (t, _x, _y) in combo))
-            if best_area is None or area > best_area or (area == best_area and score > best_score):
-                best = combo
-                best_area = area
-                best_score = score
-
-        if best is None:
-            return None, None, None
-
-        centres = [[x + w / 2, y + _h / 2] for (_t, x, y) in best]
-        avg_t = float(sum(t for (t, _x, _y) in best) / 4)
-        rects = [(x, y, w, _h) for (_t, x, y) in best]
+        # Score every 4-candidate combination at once: prefer the widest spread
+        # of centres (bounding-box area), then the highest summed match.
+        cand_centres = np.column_stack((cand_x + w / 2, cand_y + _h / 2))
+        combos = _marker_combinations(len(cand_x))
+        combo_xy = cand_centres.astype(np.float32)[combos]
+        spans = combo_xy.max(axis=1) - combo_xy.min(axis=1)
+        areas = spans[:, 0] * spans[:, 1]
+        # Match values are float32, so these float64 sums are exact in any order.
+        scores = cand_t[combos].sum(axis=1)
+        # lexsort is stable, so full ties keep the first combination.
+        best_idx = np.lexsort((-scores, -areas))[0]
+        best = combos[best_idx]
+
+        centres = cand_centres[best].tolist()
+        avg_t = float(scores[best_idx] / 4)
+        rects = [
+            (x, y, w, _h) for x, y in zip(cand_x[best].tolist(), cand_y[best].tolist())
+        ]
         return centres, rects, avg_t
 
     def apply_filter(self, image, file_path):
         config = self.tuning_config
         image_instance_ops = self.image_instance_ops
-        image_eroded_sub = ImageUtils.normalize_util(
-            image
-            if self.apply_erode_subtract
-            else (
+        if self.apply_erode_subtract and self.already_normalized:
+            # Still a copy: the quadrant lines below must not reach the page.
+            image_eroded_sub = image.copy()
+        else:
+            image_eroded_sub = ImageUtils.normalize_util(
                 image
-                - cv2.erode(
-                    image,
-                    kernel=np.ones(EROSION_PARAMS["kernel_size"]),
-                    iterations=EROSION_PARAMS["iterations"],
+                if self.apply_erode_subtract
+                else (
+                    image
+                    - cv2.erode(
+                        image,
+                        kernel=_ERODE_KERNEL,
+                        iterations=EROSION_PARAMS["iterations"],
+                    )
                 )
             )
-        )
-        quads = {}
-        origins = [[0, 0], [0, 0], [0, 0], [0, 0]]
+        # Quadrant extents as (y0, y1, x0, x1)
+        quad_bounds = []
         if self.search_mode not in {"global", "full", "all"}:
             # Quads on warped image
             h1, w1 = image_eroded_sub.shape[:2]
@@ -135,42 +228,49 @@ class CropOnMarkers(ImagePreprocessor):
                 h1 // QUADRANT_DIVISION["height_factor"],
                 w1 // QUADRANT_DIVISION["width_factor"],
             )
-            origins = [[0, 0], [midw, 0], [0, midh], [midw, midh]]
-            quads[0] = image_eroded_sub[0:midh, 0:midw]
-            quads[1] = image_eroded_sub[0:midh, midw:w1]
-            quads[2] = image_eroded_sub[midh:h1, 0:midw]
-            quads[3] = image_eroded_sub[midh:h1, midw:w1]
+            quad_bounds = [
+                (0, midh, 0, midw),
+                (0, midh, midw, w1),
+                (midh, h1, 0, midw),
+                (midh, h1, midw, w1),
+            ]
 
             # Draw Quadlines (quadrant mode debugging)
             image_eroded_sub[:, midw : midw + 2] = DEFAULT_WHITE_COLOR
             image_eroded_sub[midh : midh + 2, :] = DEFAULT_WHITE_COLOR
 
-        best_scale, all_max_t = self.getBestMatch(image_eroded_sub)
+        # Every match below runs on this single float32 copy.
+        image_match = image_eroded_sub.astype(np.float32)
+        best_scale, all_max_t = self.getBestMatch(image_match)
         if best_scale is None:
             if config.outputs.show_image_level >= 1:
                 InteractionUtils.show("Quads", image_eroded_sub, config=config)
             return None
 
-        optimal_marker = ImageUtils.resize_util_h(
-            self.marker, u_height=int(self.marker.shape[0] * best_scale)
-        )
+        optimal_marker = self.rescaled_markers[best_scale]
         _h, w = optimal_marker.shape[:2]
         centres = []
         rects = []
         avg_t = 0.0
+        res_full = cv2.matchTemplate(
+            image_match, optimal_marker, cv2.TM_CCOEFF_NORMED
+        )
 
         if self.search_mode in {"global", "full", "all"}:
             centres, rects, avg_t = self._get_centres_global(
-                image_eroded_sub, optimal_marker, file_path
+                image_eroded_sub, optimal_marker, file_path, res_full
             )
             if centres is None:
                 return None
         else:
             sum_t, max_t = 0, 0
             quarter_match_log = "Matching Marker:  "
-            for k in range(0, 4):
-                res = cv2.matchTemplate(quads[k], optimal_marker, cv2.TM_CCOEFF_NORMED)
-                max_t = res.max()
+            # A placement lies inside a quadrant exactly when its top-left
+            # corner is in that quadrant's slice of the full match.
+            for k, (y0, y1, x0, x1) in enumerate(quad_bounds):
+                res = res_full[y0 : y1 - _h + 1, x0 : x1 - w + 1]
+                _min_val, _max_val, _min_loc, max_loc = cv2.minMaxLoc(res)
+                max_t = res[max_loc[1], max_loc[0]]
                 quarter_match_log += f"Quarter{str(k + 1)}: {str(round(max_t, 3))}\t"
                 if (
                     max_t < self.min_matching_threshold
@@ -178,7 +278,7 @@ class CropOnMarkers(ImagePreprocessor):
                 ):
                     if self.search_mode in {"auto", "fallback"}:
                         centres, rects, avg_t = self._get_centres_global(
-                            image_eroded_sub, optimal_marker, file_path
+                            image_eroded_sub, optimal_marker, file_path, res_full
                         )
                         if centres is None:
                             return None
@@ -212,10 +312,7 @@ class CropOnMarkers(ImagePreprocessor):
                         )
                     return None
 
-                pt = np.argwhere(res == max_t)[0]
-                pt = [pt[1], pt[0]]
-                pt[0] += origins[k][0]
-                pt[1] += origins[k][1]
+                pt = [max_loc[0] + x0, max_loc[1] + y0]
                 rects.append((pt[0], pt[1], w, _h))
                 centres.append([pt[0] + w / 2, pt[1] + _h / 2])
                 sum_t += max_t
@@ -229,19 +326,31 @@ class CropOnMarkers(ImagePreprocessor):
         if avg_t:
             self.threshold_circles.append(avg_t)
 
-        for (x, y, rw, rh) in rects:
-            pt = (int(x), int(y))
-            image = cv2.rectangle(
-                image,
-                pt,
-                (int(x + rw), int(y + rh)),
-                MARKER_RECTANGLE_COLOR,
-                DEFAULT_LINE_WIDTH,
-            )
-            image_eroded_sub = cv2.rectangle(
+        # The eroded view is only ever saved or shown for debugging.
+        show_eroded = 2 <= config.outputs.show_image_level < 4
+        draw_eroded = show_eroded or image_instance_ops.save_image_level >= 2
+        # All marker outlines in one call per image; cv2.rectangle draws the
+        # same closed polyline internally.
+        outlines = np.array(
+            [
+                [
+                    [int(x), int(y)],
+                    [int(x + rw), int(y)],
+                    [int(x + rw), int(y + rh)],
+                    [int(x), int(y + rh)],
+                ]
+                for (x, y, rw, rh) in rects
+            ],
+            dtype=np.int32,
+        )
+        image = cv2.polylines(
+            image, outlines, True, MARKER_RECTANGLE_COLOR, DEFAULT_LINE_WIDTH
+        )
+        if draw_eroded:
+            image_eroded_sub = cv2.polylines(
                 image_eroded_sub,
-                pt,
-                (int(x + rw), int(y + rh)),
+                outlines,
+                True,
                 ERODE_RECT_COLOR if self.apply_erode_subtract else NORMAL_RECT_COLOR,
                 4,
             )
@@ -250,13 +359,14 @@ class CropOnMarkers(ImagePreprocessor):
         # appendSaveImg(1,image_eroded_sub)
         # appendSaveImg(1,image_norm)
 
-        image_instance_ops.append_save_img(2, image_eroded_sub)
+        if draw_eroded:
+            image_instance_ops.append_save_img(2, image_eroded_sub)
         # Debugging image -
         # res = cv2.matchTemplate(image_eroded_sub,optimal_marker,cv2.TM_CCOEFF_NORMED)
         # res[ : , midw:midw+2] = 255
         # res[ midh:midh+2, : ] = 255
         # show("Markers Matching",res)
-        if config.outputs.show_image_level >= 2 and config.outputs.show_image_level < 4:
+        if show_eroded:
             image_eroded_sub = ImageUtils.resize_util_h(
                 image_eroded_sub, image.shape[0]
             )
@@ -284,47 +394,23 @@ class CropOnMarkers(ImagePreprocessor):
             )
             exit(31)
 
-        marker = cv2.imread(self.marker_path, cv2.IMREAD_GRAYSCALE)
-
-        if "sheetToMarkerWidthRatio" in marker_ops:
-            marker = ImageUtils.resize_util(
-                marker,
-                config.dimensions.processing_width
-                / int(marker_ops["sheetToMarkerWidthRatio"]),
-            )
-        marker = cv2.GaussianBlur(
-            marker,
-            DEFAULT_GAUSSIAN_BLUR_PARAMS_MARKER["kernel_size"],
-            DEFAULT_GAUSSIAN_BLUR_PARAMS_MARKER["sigma_x"],
+        # The mtime is part of the key so an edited marker file is reloaded.
+        return _prepare_marker(
+            self.marker_path,
+            os.path.getmtime(self.marker_path),
+            marker_ops.get("sheetToMarkerWidthRatio"),
+            config.dimensions.processing_width,
+            self.apply_erode_subtract,
         )
-        marker = cv2.normalize(
-            marker,
-            None,
-            alpha=DEFAULT_NORMALIZE_PARAMS["alpha"],
-            beta=DEFAULT_NORMALIZE_PARAMS["beta"],
-            norm_type=cv2.NORM_MINMAX,
-        )
-
-        if self.apply_erode_subtract:
-            marker -= cv2.erode(
-                marker,
-                kernel=np.ones(EROSION_PARAMS["kernel_size"]),
-                iterations=EROSION_PARAMS["iterations"],
-            )
-
-        return marker
 
-    # Resizing the marker within scaleRange at rate of descent_per_step to
-    # find the best match.
-    def getBestMatch(self, image_eroded_sub):
-        config = self.tuning_config
+    # Resizing the marker within scaleRange at rate of descent_per_step, keyed
+    # by scale. Markers big enough to survive a pyrDown also get a coarse copy.
+    def _build_rescaled_markers(self):
         descent_per_step = (
             self.marker_rescale_range[1] - self.marker_rescale_range[0]
         ) // self.marker_rescale_steps
         _h, _w = self.marker.shape[:2]
-        res, best_scale = None, None
-        all_max_t = 0
-
+        rescaled_markers, coarse_markers = {}, {}
         for r0 in np.arange(
             self.marker_rescale_range[1],
             self.marker_rescale_range[0],
@@ -336,22 +422,99 @@ class CropOnMarkers(ImagePreprocessor):
             rescaled_marker = ImageUtils.resize_util_h(
                 self.marker, u_height=int(_h * s)
             )
-            # res is the black image with white dots
-            res = cv2.matchTemplate(
-                image_eroded_sub, rescaled_marker, cv2.TM_CCOEFF_NORMED
+            # matchTemplate promotes 8-bit inputs to float32 on every call;
+            # store the markers pre-converted so that happens once per batch.
+            rescaled_markers[s] = rescaled_marker.astype(np.float32)
+            if min(rescaled_marker.shape[:2]) >= 2 * MARKER_PYRAMID_MIN_SIZE:
+                coarse_markers[s] = cv2.pyrDown(rescaled_marker).astype(np.float32)
+        return rescaled_markers, coarse_markers
+
+    def _match_markers(self, image, markers):
+        # cv2.matchTemplate releases the GIL, so independent scales can run on
+        # separate cores. Results come back in marker order either way.
+        if not self.parallel_scale_search or len(markers) <= 1:
+            return [_match_marker(image, marker) for marker in markers]
+        pool = _scale_search_pool()
+        if pool is None:
+            return [_match_marker(image, marker) for marker in markers]
+        return list(pool.map(partial(_match_marker, image), markers))
+
+    # First scale (in descending scale order) with the highest match wins.
+    def _pick_best_scale(self, scores):
+        best_scale, all_max_t = None, 0
+        for s in self.rescaled_markers:
+            if s in scores and all_max_t < scores[s]:
+                # print('Scale: '+str(s)+', Circle Match: '+str(round(max_t*100,2))+'%')
+                best_scale, all_max_t = s, scores[s]
+        return best_scale, all_max_t
+
+    # Full-resolution match per scale: record each max_t in scores and return
+    # the response maps of this pass only.
+    def _match_full_scales(self, image_match, scales, scores):
+        matches = self._match_markers(
+            image_match, [self.rescaled_markers[s] for s in scales]
+        )
+        responses = {}
+        for s, (max_t, res) in zip(scales, matches):
+            scores[s] = max_t
+            responses[s] = res
+        return responses
+
+    # Matching the rescaled markers to find the best scale.
+    def getBestMatch(self, image_match):
+        config = self.tuning_config
+
+        # Coarse pass: rank scales on a half-resolution level (a quarter of the
+        # pixels against a quarter-size marker), then refine only the leaders.
+        image_coarse = cv2.pyrDown(image_match)
+        coarse_scales = list(self.coarse_markers)
+        coarse_scores = [
+            max_t
+            for max_t, _res in self._match_markers(
+                image_coarse, [self.coarse_markers[s] for s in coarse_scales]
+            )
+        ]
+        coarse_ranking = sorted(
+            zip(coarse_scores, coarse_scales),
+            key=lambda ranked: -ranked[0],
+        )
+        refine_scales = {
+            s for s in self.rescaled_markers if s not in self.coarse_markers
+        }
+        if coarse_ranking:
+            # Leaders that trail the best coarse match by more than the margin
+            # cannot plausibly win at full resolution; skip their full match.
+            prune_below = coarse_ranking[0][0] - MARKER_PYRAMID_PRUNE_MARGIN
+            refine_scales.update(
+                s
+                for (coarse_t, s) in coarse_ranking[:MARKER_PYRAMID_REFINE_SCALES]
+                if coarse_t >= prune_below
             )
 
-            max_t = res.max()
-            if all_max_t < max_t:
-                # print('Scale: '+str(s)+', Circle Match: '+str(round(max_t*100,2))+'%')
-                best_scale, all_max_t = s, max_t
+        # Only the per-scale scores and the winning response map are kept.
+        scores = {}
+        scales = [s for s in self.rescaled_markers if s in refine_scales]
+        responses = self._match_full_scales(image_match, scales, scores)
+        best_scale, all_max_t = self._pick_best_scale(scores)
+        best_res = responses.get(best_scale)
+        responses = None
+
+        if all_max_t < self.min_matching_threshold:
+            # The coarse ranking may have pruned the right scale; before giving
+            # up, sweep the rest at full resolution like the exhaustive search.
+            scales = [s for s in self.rescaled_markers if s not in scores]
+            if scales:
+                responses = self._match_full_scales(image_match, scales, scores)
+                best_scale, all_max_t = self._pick_best_scale(scores)
+                best_res = responses.get(best_scale, best_res)
+                responses = None
 
         if all_max_t < self.min_matching_threshold:
             logger.warning(
                 "\tTemplate matching too low! Consider rechecking preProcessors applied before this."
             )
-            if config.outputs.show_image_level >= 1:
-                InteractionUtils.show("res", res, 1, 0, config=config)
+            if config.outputs.show_image_level >= 1 and best_res is not None:
+                InteractionUtils.show("res", best_res, 1, 0, config=config)
 
         if best_scale is None:
             logger.warning(
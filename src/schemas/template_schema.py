@@ -89,6 +89,7 @@ TEMPLATE_SCHEMA = {
                                     "type": "object",
                                     "additionalProperties": False,
                                     "properties": {
+                                        "alreadyNormalized": {"type": "boolean"},
                                         "apply_erode_subtract": {"type": "boolean"},
                                         "searchMode": {
                                             "type": "string",
@@ -99,6 +100,7 @@ TEMPLATE_SCHEMA = {
                                         "marker_rescale_steps": {"type": "number"},
                                         "max_matching_variation": {"type": "number"},
                                         "min_matching_threshold": {"type": "number"},
+                                        "parallelScaleSearch": {"type": "boolean"},
                                         "relativePath": {"type": "string"},
                                         "sheetToMarkerWidthRatio": {"type": "number"},
                                     },
@@ -0,0 +1,54 @@
+import numpy as np
+
+# The processor manager imports every processor module on load; going through
+# it first avoids the circular import when loading one processor directly.
+import src.processors.manager  # noqa: F401
+from src.processors.CropOnMarkers import _find_marker_candidates
+
+MARKER_SIZE = 20
+THRESHOLD = 0.3
+
+
+def find_candidates(res):
+    xs, ys = _find_marker_candidates(res, MARKER_SIZE, MARKER_SIZE, THRESHOLD)
+    return list(zip(xs.tolist(), ys.tolist()))
+
+
+def test_plateau_yields_single_candidate():
+    res = np.zeros((200, 200), dtype=np.float32)
+    res[50:53, 50:53] = 0.9
+    res[50, 150] = 0.8
+    res[150, 50] = 0.8
+    res[150, 150] = 0.8
+
+    assert find_candidates(res) == [(50, 50), (150, 50), (50, 150), (150, 150)]
+
+
+def test_plateaus_do_not_crowd_out_markers():
+    res = np.zeros((400, 400), dtype=np.float32)
+    for x in (100, 200, 300):
+        res[200:204, x : x + 4] = 0.95
+    for x, y in ((10, 10), (380, 10), (10, 380), (380, 380)):
+        res[y, x] = 0.7
+
+    candidates = find_candidates(res)
+
+    assert len(candidates) == 7
+    assert {(10, 10), (380, 10), (10, 380), (380, 380)} <= set(candidates)
+
+
+def test_point_next_to_suppressed_neighbour_is_kept():
+    res = np.zeros((100, 200), dtype=np.float32)
+    res[50, 100] = 0.95
+    # Within the suppression window of the strongest peak.
+    res[50, 115] = 0.9
+    # Only near the suppressed peak, so greedy suppression keeps it.
+    res[50, 130] = 0.85
+
+    assert find_candidates(res) == [(100, 50), (130, 50)]
+
+
+def test_below_threshold_is_ignored():
+    res = np.full((50, 50), THRESHOLD / 2, dtype=np.float32)
+
+    assert find_candidates(res) == []
@@ -0,0 +1,32 @@
+from dataclasses import replace
+
+from omr_gui.core.id_sheet_generator import IdSheetParams, generate_id_sheets_batch
+
+PARAMS = IdSheetParams(
+    num_digits=4,
+    page_width=800,
+    page_height=1000,
+    margin_left=60,
+    margin_top=60,
+    bubble_radius=14,
+    labels_gap=52,
+    bubbles_gap=42,
+)
+
+
+def test_generate_id_sheets_batch_keeps_job_order(tmp_path):
+    jobs = [
+        (PARAMS, tmp_path / "first", "first"),
+        (replace(PARAMS, num_digits=6), tmp_path / "second", "second"),
+    ]
+
+    sheets = generate_id_sheets_batch(jobs, max_workers=2)
+
+    assert [sheet.image_path.parent.parent for sheet in sheets] == [
+        tmp_path / "first",
+        tmp_path / "second",
+    ]
+    for sheet in sheets:
+        assert sheet.image_path.is_file()
+        assert sheet.template_path.is_file()
+        assert (sheet.image_path.parent / "omr_marker.jpg").is_file()
@@ -0,0 +1,41 @@
+import pytest
+
+from omr_gui.core import json_io
+
+TEMPLATE = {
+    "pageDimensions": [1846, 1500],
+    "bubbleDimensions": [40.5, 40],
+    "fieldBlocks": {
+        "Naam_नाम": {
+            "fieldType": "QTYPE_MCQ4",
+            "fieldLabels": ["प्रश्न1", "Frage_ü2"],
+            "origin": [65, 60],
+        }
+    },
+    "customLabels": {},
+    "preProcessors": [],
+}
+
+
+def test_dumps_round_trips_non_ascii_without_orjson(monkeypatch, tmp_path):
+    monkeypatch.setattr(json_io, "orjson", None)
+    path = tmp_path / "template.json"
+
+    json_io.write_json(path, TEMPLATE)
+
+    raw = path.read_bytes()
+    assert "प्रश्न1".encode("utf-8") in raw
+    assert b"\\u" not in raw
+    assert json_io.read_json(path) == TEMPLATE
+
+
+def test_dumps_matches_fallback_with_orjson(monkeypatch, tmp_path):
+    pytest.importorskip("orjson")
+    path = tmp_path / "template.json"
+
+    json_io.write_json(path, TEMPLATE)
+    assert json_io.read_json(path) == TEMPLATE
+
+    raw = path.read_bytes()
+    monkeypatch.setattr(json_io, "orjson", None)
+    assert json_io.dumps(TEMPLATE) == raw
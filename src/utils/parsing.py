@@ -15,6 +15,10 @@ from src.utils.validations import (
     validate_template_json,
 )
 
+# Compiled once here; custom_sort_output_columns runs as a sort key per column.
+FIELD_STRING_PATTERN = re.compile(FIELD_STRING_REGEX_GROUPS)
+FIELD_LABEL_NUMBER_PATTERN = re.compile(FIELD_LABEL_NUMBER_REGEX)
+
 OVERRIDE_MERGER = Merger(
     # pass in a list of tuples,with the
     # strategies you are looking to apply
@@ -85,9 +89,7 @@ def parse_fields(key, fields):
 
 def parse_field_string(field_string):
     if "." in field_string:
-        field_prefix, start, end = re.findall(FIELD_STRING_REGEX_GROUPS, field_string)[
-            0
-        ]
+        field_prefix, start, end = FIELD_STRING_PATTERN.findall(field_string)[0]
         start, end = int(start), int(end)
         if start >= end:
             raise Exception(
@@ -101,7 +103,7 @@ def parse_field_string(field_string):
 
 
 def custom_sort_output_columns(field_label):
-    label_prefix, label_suffix = re.findall(FIELD_LABEL_NUMBER_REGEX, field_label)[0]
+    label_prefix, label_suffix = FIELD_LABEL_NUMBER_PATTERN.findall(field_label)[0]
     return [label_prefix, int(label_suffix) if len(label_suffix) > 0 else 0]
 
 